@@ -129,11 +129,19 @@ class AutomationDashboard:
         
         feedback_data = self._load_json("generation_feedback.json")
         
-        generations = feedback_data.get("generations", [])
+        # Generations are kept in an append-only JSONL log; older installs
+        # still embed them in the aggregate JSON until the first migration
+        total_generated = len(feedback_data.get("generations", []))
+        log_file = self.data_dir / 'generation_feedback.jsonl'
+        if log_file.exists():
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip() and json.loads(line).get("doc_type") != "feedback":
+                        total_generated += 1
         scores = feedback_data.get("feedback_scores", [])
         
         return {
-            "total_generated": len(generations),
+            "total_generated": total_generated,
             "avg_score": sum(scores) / len(scores) if scores else 0,
             "successful_patterns": len(feedback_data.get("successful_patterns", [])),
             "failed_patterns": len(feedback_data.get("failed_patterns", []))
@@ -3,54 +3,110 @@ Professional Document Generator - Creates visually appealing resumes and cover l
 Supports PDF, DOCX, and HTML output formats with proper formatting and layout
 """
 import os
+import re
 import json
-import yaml
+import hashlib
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from statistics import fmean
 from typing import Dict, Optional, List
 from pathlib import Path
 
-# Try to import document libraries
-try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.style import WD_STYLE_TYPE
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# Document libraries are heavy to import, so only check that they are
+# installed here; the PDF/DOCX writers import them on first use
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
 
 
 def load_config() -> dict:
     """Load configuration from config.yaml"""
+    import yaml
+    
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
     with open(config_path, 'r') as f:
         return yaml.safe_load(f)
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> str:
+    """Create a directory once per process; repeat calls skip the filesystem."""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 def get_learning_db_path() -> str:
-    """Get path to the learning database for self-improvement."""
+    """Get path to the learning database for self-improvement.
+
+    This small JSON file only holds the aggregate analytics (patterns and
+    scores); individual generations live in the append-only log returned by
+    ``get_generation_log_path``.
+    """
     return os.path.join(os.path.dirname(__file__), '..', 'data', 'generation_feedback.json')
 
 
+def get_generation_log_path() -> str:
+    """Get path to the append-only JSONL log of generation records."""
+    return os.path.join(os.path.dirname(__file__), '..', 'data', 'generation_feedback.jsonl')
+
+
+def _migrate_legacy_generations():
+    """Move generations embedded in the old single-file JSON layout into the log."""
+    db_path = get_learning_db_path()
+    if os.path.exists(get_generation_log_path()) or not os.path.exists(db_path):
+        return
+    with open(db_path, 'r') as f:
+        data = json.load(f)
+    legacy_generations = data.pop("generations", [])
+    log_path = get_generation_log_path()
+    with open(log_path, 'w', encoding='utf-8') as f:
+        for entry in legacy_generations:
+            f.write(json.dumps(entry) + '\n')
+    save_learning_data(data)
+
+
+def _append_generation_log(entry: Dict):
+    """Append a single record to the generation log (no rewrite of prior records)."""
+    _migrate_legacy_generations()
+    log_path = get_generation_log_path()
+    _ensure_dir(os.path.dirname(log_path))
+    with open(log_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry) + '\n')
+
+
+def iter_generations_reversed(block_size: int = 8192):
+    """Yield generation log records newest-first, reading the file backwards in blocks."""
+    _migrate_legacy_generations()
+    log_path = get_generation_log_path()
+    if not os.path.exists(log_path):
+        return
+    with open(log_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b'\n')
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield json.loads(line)
+        if remainder.strip():
+            yield json.loads(remainder)
+
+
 def load_learning_data() -> Dict:
-    """Load historical generation feedback for self-improvement."""
+    """Load the aggregate learning analytics for self-improvement."""
     db_path = get_learning_db_path()
+    _migrate_legacy_generations()
     if os.path.exists(db_path):
         with open(db_path, 'r') as f:
             return json.load(f)
     return {
-        "generations": [],
         "successful_patterns": [],
         "failed_patterns": [],
         "feedback_scores": [],
@@ -59,9 +115,9 @@ def load_learning_data() -> Dict:
 
 
 def save_learning_data(data: Dict):
-    """Save learning data for future improvement."""
+    """Save learning analytics for future improvement."""
     db_path = get_learning_db_path()
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    _ensure_dir(os.path.dirname(db_path))
     with open(db_path, 'w') as f:
         json.dump(data, f, indent=2)
 
@@ -76,8 +132,6 @@ def record_generation(
     score: Optional[int] = None
 ):
     """Record a document generation for learning purposes."""
-    data = load_learning_data()
-    
     entry = {
         "timestamp": datetime.now().isoformat(),
         "doc_type": doc_type,
@@ -89,16 +143,24 @@ def record_generation(
         "score": score
     }
     
-    data["generations"].append(entry)
+    _append_generation_log(entry)
+    
+    # Only touch the aggregate analytics when this entry changes them
+    successful = success and score and score >= 8
+    failed = not success or (score and score < 5)
+    if not (successful or failed or score):
+        return
+    
+    data = load_learning_data()
     
     # Analyze patterns
-    if success and score and score >= 8:
+    if successful:
         data["successful_patterns"].append({
             "job_title": job_title,
             "industry": extract_industry(job_title),
             "timestamp": entry["timestamp"]
         })
-    elif not success or (score and score < 5):
+    elif failed:
         data["failed_patterns"].append({
             "job_title": job_title,
             "feedback": feedback,
@@ -111,15 +173,19 @@ def record_generation(
     save_learning_data(data)
 
 
+# Checked in priority order, so a "Marketing Designer" is still classed as design
+_INDUSTRY_PATTERNS = (
+    ("design", re.compile(r'design|creative|graphic|visual|brand', re.IGNORECASE)),
+    ("marketing", re.compile(r'market|content|social', re.IGNORECASE)),
+    ("tech", re.compile(r'develop|engineer|software|tech', re.IGNORECASE)),
+)
+
+
 def extract_industry(job_title: str) -> str:
     """Extract industry from job title for pattern learning."""
-    title_lower = job_title.lower()
-    if any(w in title_lower for w in ['design', 'creative', 'graphic', 'visual', 'brand']):
-        return "design"
-    elif any(w in title_lower for w in ['market', 'content', 'social']):
-        return "marketing"
-    elif any(w in title_lower for w in ['develop', 'engineer', 'software', 'tech']):
-        return "tech"
+    for industry, pattern in _INDUSTRY_PATTERNS:
+        if pattern.search(job_title):
+            return industry
     return "general"
 
 
@@ -129,24 +195,190 @@ def get_learned_improvements() -> List[str]:
     improvements = []
     
     # Analyze feedback scores
-    if data["feedback_scores"]:
-        avg_score = sum(data["feedback_scores"]) / len(data["feedback_scores"])
+    if data.get("feedback_scores"):
+        avg_score = fmean(data["feedback_scores"])
         if avg_score < 7:
             improvements.append("Focus on more specific achievements with metrics")
     
     # Analyze failed patterns
-    for pattern in data["failed_patterns"][-10:]:  # Last 10 failures
+    for pattern in data.get("failed_patterns", [])[-10:]:  # Last 10 failures
         if pattern.get("feedback"):
-            if "generic" in pattern["feedback"].lower():
+            feedback_lower = pattern["feedback"].lower()
+            if "generic" in feedback_lower:
                 improvements.append("Make content more specific to the role")
-            if "long" in pattern["feedback"].lower():
+            if "long" in feedback_lower:
                 improvements.append("Keep content more concise")
     
     return list(set(improvements))
 
 
+# ============== GENERATION CACHE ==============
+
+# In-process copy of the on-disk cache, keyed by (kind, key); least recently
+# used entries are dropped once it holds GENERATION_CACHE_SIZE results
+GENERATION_CACHE_SIZE = 64
+_GENERATION_CACHE: "OrderedDict[tuple, Dict]" = OrderedDict()
+
+
+def get_generation_cache_dir() -> str:
+    """Get the directory holding cached tailor/cover-letter outputs."""
+    return os.path.join(os.path.dirname(__file__), '..', 'data', 'tailor_cache')
+
+
+def generation_cache_key(resume_text: str, job_title: str, company: str, job_description: str) -> str:
+    """Stable content hash of the inputs that determine a generation."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (resume_text, job_title, company, job_description):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _remember(kind: str, key: str, result: Dict) -> None:
+    _GENERATION_CACHE[(kind, key)] = result
+    _GENERATION_CACHE.move_to_end((kind, key))
+    while len(_GENERATION_CACHE) > GENERATION_CACHE_SIZE:
+        _GENERATION_CACHE.popitem(last=False)
+
+
+def _is_complete_tailor(result: Dict) -> bool:
+    """False for tailor_resume output built on the empty-keyword fallback."""
+    keywords = result.get('job_keywords') or {}
+    has_keywords = any(keywords.get(k) for k in ('required_skills', 'preferred_skills', 'ats_keywords'))
+    return has_keywords and bool((result.get('tailored_summary') or '').strip())
+
+
+def _is_complete_cover_letter(result: Dict) -> bool:
+    """False when write_cover_letter came back without a letter."""
+    return bool((result.get('cover_letter') or '').strip())
+
+
+def _cached_call(kind: str, key: str, fn, is_complete=None) -> Dict:
+    """
+    Return a cached result for (kind, key), calling fn and storing it on a miss.
+    Results rejected by is_complete (fallback/degraded output) are returned
+    but not stored, so the next run asks the LLM again.
+    """
+    if (kind, key) in _GENERATION_CACHE:
+        _GENERATION_CACHE.move_to_end((kind, key))
+        return _GENERATION_CACHE[(kind, key)]
+    
+    cache_path = os.path.join(get_generation_cache_dir(), f"{kind}_{key}.json")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+            _remember(kind, key, result)
+            return result
+        except (OSError, ValueError):
+            pass
+    
+    result = fn()
+    if is_complete is not None and not is_complete(result):
+        return result
+    _remember(kind, key, result)
+    try:
+        _ensure_dir(os.path.dirname(cache_path))
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+    except (OSError, TypeError) as e:
+        print(f"  ⚠️ Could not cache {kind} result: {e}")
+    return result
+
+
 # ============== PDF GENERATION ==============
 
+# Header flowables only depend on user_info, so they are built once per user
+# and reused across every document in a batch run
+@lru_cache(maxsize=8)
+def _build_resume_header(user_key: tuple) -> tuple:
+    """Build the resume name/contact/links header flowables for one user."""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import Paragraph, Spacer, HRFlowable
+    
+    user_info = dict(user_key)
+    styles = getSampleStyleSheet()
+    
+    name_style = ParagraphStyle(
+        'Name',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1a1a1a'),
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    contact_style = ParagraphStyle(
+        'Contact',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.HexColor('#555555'),
+        alignment=TA_CENTER,
+        spaceAfter=12
+    )
+    
+    header = []
+    
+    # Header with name
+    header.append(Paragraph(user_info.get('name', 'Name'), name_style))
+    
+    # Contact info line
+    contact_parts = []
+    if user_info.get('email'):
+        contact_parts.append(user_info['email'])
+    if user_info.get('phone'):
+        contact_parts.append(user_info['phone'])
+    if user_info.get('location'):
+        contact_parts.append(user_info['location'])
+    
+    header.append(Paragraph(' | '.join(contact_parts), contact_style))
+    
+    # Links line
+    link_parts = []
+    if user_info.get('linkedin'):
+        link_parts.append(f'<link href="{user_info["linkedin"]}">LinkedIn</link>')
+    if user_info.get('portfolio'):
+        link_parts.append(f'<link href="{user_info["portfolio"]}">Portfolio</link>')
+    
+    if link_parts:
+        header.append(Paragraph(' | '.join(link_parts), contact_style))
+    
+    # Divider
+    header.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor('#2c5282')))
+    header.append(Spacer(1, 6))
+    
+    return tuple(header)
+
+
+@lru_cache(maxsize=8)
+def _build_cover_letter_header(user_key: tuple) -> tuple:
+    """Build the cover letter contact block flowables for one user."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import Paragraph
+    
+    user_info = dict(user_key)
+    styles = getSampleStyleSheet()
+    
+    header_style = ParagraphStyle(
+        'Header',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#333333'),
+        spaceAfter=3
+    )
+    
+    return (
+        Paragraph(f"<b>{user_info.get('name', '')}</b>", header_style),
+        Paragraph(user_info.get('email', ''), header_style),
+        Paragraph(user_info.get('phone', ''), header_style),
+        Paragraph(user_info.get('location', ''), header_style),
+    )
+
+
 def create_resume_pdf(
     output_path: str,
     user_info: Dict,
@@ -173,6 +405,13 @@ def create_resume_pdf(
         print("ReportLab not installed. Run: pip install reportlab")
         return False
     
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_JUSTIFY
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
+    
     doc = SimpleDocTemplate(
         output_path,
         pagesize=letter,
@@ -186,25 +425,6 @@ def create_resume_pdf(
     styles = getSampleStyleSheet()
     
     # Custom styles for professional look
-    name_style = ParagraphStyle(
-        'Name',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=6,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    contact_style = ParagraphStyle(
-        'Contact',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#555555'),
-        alignment=TA_CENTER,
-        spaceAfter=12
-    )
-    
     section_header_style = ParagraphStyle(
         'SectionHeader',
         parent=styles['Heading2'],
@@ -247,74 +467,63 @@ def create_resume_pdf(
     # Build document content
     story = []
     
-    # Header with name
-    story.append(Paragraph(user_info.get('name', 'Name'), name_style))
-    
-    # Contact info line
-    contact_parts = []
-    if user_info.get('email'):
-        contact_parts.append(user_info['email'])
-    if user_info.get('phone'):
-        contact_parts.append(user_info['phone'])
-    if user_info.get('location'):
-        contact_parts.append(user_info['location'])
-    
-    story.append(Paragraph(' | '.join(contact_parts), contact_style))
-    
-    # Links line
-    link_parts = []
-    if user_info.get('linkedin'):
-        link_parts.append(f'<link href="{user_info["linkedin"]}">LinkedIn</link>')
-    if user_info.get('portfolio'):
-        link_parts.append(f'<link href="{user_info["portfolio"]}">Portfolio</link>')
-    
-    if link_parts:
-        story.append(Paragraph(' | '.join(link_parts), contact_style))
-    
-    # Divider
-    story.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor('#2c5282')))
-    story.append(Spacer(1, 6))
+    # Name, contact and links header is identical for every job of a user
+    story.extend(_build_resume_header(tuple(sorted(user_info.items()))))
     
     # Professional Summary
     story.append(Paragraph('PROFESSIONAL SUMMARY', section_header_style))
     story.append(Paragraph(tailored_summary, body_style))
     
+    # Sections below run once per skill/job/bullet, so keep the loops lean
+    add = story.append
+    
+    # Bullet rows carry their indent in bullet_style, so the cells add no padding
+    bullet_table_style = TableStyle([
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ])
+    
     # Skills
     if skills:
-        story.append(Paragraph('SKILLS', section_header_style))
-        for category, skill_list in skills.items():
-            if skill_list:
-                skills_text = f"<b>{category}:</b> {', '.join(skill_list)}"
-                story.append(Paragraph(skills_text, body_style))
+        add(Paragraph('SKILLS', section_header_style))
+        story.extend(
+            Paragraph(f"<b>{category}:</b> {', '.join(skill_list)}", body_style)
+            for category, skill_list in skills.items() if skill_list
+        )
     
     # Experience
     if experience:
-        story.append(Paragraph('EXPERIENCE', section_header_style))
+        add(Paragraph('EXPERIENCE', section_header_style))
         for job in experience:
-            title_line = f"<b>{job.get('title', '')}</b> – {job.get('company', '')}"
-            if job.get('dates'):
-                title_line += f" <i>({job['dates']})</i>"
-            story.append(Paragraph(title_line, job_title_style))
+            dates = job.get('dates')
+            dates_suffix = f" <i>({dates})</i>" if dates else ""
+            add(Paragraph(f"<b>{job.get('title', '')}</b> – {job.get('company', '')}{dates_suffix}", job_title_style))
             
             if job.get('location'):
-                story.append(Paragraph(job['location'], body_style))
+                add(Paragraph(job['location'], body_style))
             
-            for bullet in job.get('bullets', []):
-                story.append(Paragraph(f"• {bullet}", bullet_style))
+            # One Table per job lays all bullets out in a single flowable
+            bullets = job.get('bullets', [])
+            if bullets:
+                add(Table(
+                    [[Paragraph(f"• {bullet}", bullet_style)] for bullet in bullets],
+                    colWidths=[doc.width],
+                    style=bullet_table_style
+                ))
     
     # Education
     if education:
-        story.append(Paragraph('EDUCATION', section_header_style))
+        add(Paragraph('EDUCATION', section_header_style))
         for edu in education:
-            edu_line = f"<b>{edu.get('degree', '')}</b>"
-            if edu.get('school'):
-                edu_line += f" – {edu['school']}"
-            if edu.get('date'):
-                edu_line += f" ({edu['date']})"
-            story.append(Paragraph(edu_line, body_style))
+            school = edu.get('school')
+            date = edu.get('date')
+            edu_line = f"<b>{edu.get('degree', '')}</b>{f' – {school}' if school else ''}{f' ({date})' if date else ''}"
+            add(Paragraph(edu_line, body_style))
             
             if edu.get('details'):
-                story.append(Paragraph(edu['details'], bullet_style))
+                add(Paragraph(edu['details'], bullet_style))
     
     # Build PDF
     try:
@@ -340,6 +549,13 @@ def create_cover_letter_pdf(
         print("ReportLab not installed. Run: pip install reportlab")
         return False
     
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_JUSTIFY
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    
     doc = SimpleDocTemplate(
         output_path,
         pagesize=letter,
@@ -379,10 +595,7 @@ def create_cover_letter_pdf(
     story = []
     
     # Header with contact info
-    story.append(Paragraph(f"<b>{user_info.get('name', '')}</b>", header_style))
-    story.append(Paragraph(user_info.get('email', ''), header_style))
-    story.append(Paragraph(user_info.get('phone', ''), header_style))
-    story.append(Paragraph(user_info.get('location', ''), header_style))
+    story.extend(_build_cover_letter_header(tuple(sorted(user_info.items()))))
     
     # Date
     story.append(Paragraph(datetime.now().strftime('%B %d, %Y'), date_style))
@@ -426,6 +639,10 @@ def create_resume_docx(
         print("python-docx not installed. Run: pip install python-docx")
         return False
     
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches, Pt, RGBColor
+    
     doc = Document()
     
     # Set margins
@@ -541,6 +758,147 @@ def create_resume_docx(
 
 # ============== HTML GENERATION ==============
 
+_RESUME_CSS_SOURCE = """
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+    line-height: 1.6;
+    color: #1a1a1a;
+    max-width: 8.5in;
+    margin: 0 auto;
+    padding: 0.5in;
+    background: #fff;
+}
+
+header {
+    text-align: center;
+    margin-bottom: 1.5rem;
+    padding-bottom: 1rem;
+    border-bottom: 2px solid #2c5282;
+}
+
+h1 {
+    font-size: 2rem;
+    font-weight: 700;
+    color: #1a1a1a;
+    margin-bottom: 0.5rem;
+}
+
+.contact {
+    color: #555;
+    font-size: 0.9rem;
+}
+
+.contact a {
+    color: #2c5282;
+    text-decoration: none;
+}
+
+.contact a:hover {
+    text-decoration: underline;
+}
+
+section {
+    margin-bottom: 1.5rem;
+}
+
+h2 {
+    font-size: 0.85rem;
+    font-weight: 600;
+    color: #2c5282;
+    text-transform: uppercase;
+    letter-spacing: 0.05em;
+    margin-bottom: 0.75rem;
+    padding-bottom: 0.25rem;
+    border-bottom: 1px solid #e2e8f0;
+}
+
+.summary {
+    text-align: justify;
+    color: #333;
+}
+
+.job, .education-item {
+    margin-bottom: 1rem;
+}
+
+.job h3, .education-item h3 {
+    font-size: 1rem;
+    font-weight: 600;
+    color: #1a1a1a;
+}
+
+.dates {
+    font-size: 0.85rem;
+    color: #666;
+    font-style: italic;
+}
+
+ul {
+    margin-left: 1.5rem;
+    margin-top: 0.5rem;
+}
+
+li {
+    margin-bottom: 0.25rem;
+    color: #333;
+}
+
+@media print {
+    body {
+        padding: 0;
+    }
+}
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+# The stylesheet never varies between resumes, so minify it once at import
+_RESUME_CSS = _minify_css(_RESUME_CSS_SOURCE)
+
+
+# The document head and contact header only depend on user_info, so they are
+# rendered once per user and reused for every resume in a batch
+@lru_cache(maxsize=8)
+def _render_resume_html_header(user_key: tuple) -> str:
+    """Render the HTML resume from the doctype through the contact header."""
+    user_info = dict(user_key)
+    return f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{user_info.get('name', 'Resume')}</title>
+    <style>{_RESUME_CSS}</style>
+</head>
+<body>
+    <header>
+        <h1>{user_info.get('name', '')}</h1>
+        <p class="contact">
+            {user_info.get('email', '')} | {user_info.get('phone', '')} | {user_info.get('location', '')}
+        </p>
+        <p class="contact">
+            <a href="{user_info.get('linkedin', '#')}">LinkedIn</a> | 
+            <a href="{user_info.get('portfolio', '#')}">Portfolio</a>
+        </p>
+    </header>
+'''
+
+
 def create_resume_html(
     output_path: str,
     user_info: Dict,
@@ -551,150 +909,33 @@ def create_resume_html(
 ) -> bool:
     """Create a beautiful HTML resume with modern styling."""
     
-    skills_html = ""
-    for category, skill_list in skills.items():
-        if skill_list:
-            skills_html += f'<p><strong>{category}:</strong> {", ".join(skill_list)}</p>\n'
+    skills_html = ''.join(
+        f'<p><strong>{category}:</strong> {", ".join(skill_list)}</p>\n'
+        for category, skill_list in skills.items() if skill_list
+    )
     
-    experience_html = ""
+    experience_parts = []
     for job in experience:
         bullets_html = "\n".join([f"<li>{b}</li>" for b in job.get('bullets', [])])
-        experience_html += f'''
+        experience_parts.append(f'''
         <div class="job">
             <h3>{job.get('title', '')} – {job.get('company', '')}</h3>
             <p class="dates">{job.get('dates', '')} | {job.get('location', '')}</p>
             <ul>{bullets_html}</ul>
         </div>
-        '''
+        ''')
+    experience_html = ''.join(experience_parts)
     
-    education_html = ""
-    for edu in education:
-        education_html += f'''
+    education_html = ''.join(f'''
         <div class="education-item">
             <h3>{edu.get('degree', '')}</h3>
             <p>{edu.get('school', '')} – {edu.get('date', '')}</p>
             {f"<p>{edu.get('details', '')}</p>" if edu.get('details') else ''}
         </div>
-        '''
-    
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{user_info.get('name', 'Resume')}</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-        
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            line-height: 1.6;
-            color: #1a1a1a;
-            max-width: 8.5in;
-            margin: 0 auto;
-            padding: 0.5in;
-            background: #fff;
-        }}
-        
-        header {{
-            text-align: center;
-            margin-bottom: 1.5rem;
-            padding-bottom: 1rem;
-            border-bottom: 2px solid #2c5282;
-        }}
-        
-        h1 {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #1a1a1a;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .contact {{
-            color: #555;
-            font-size: 0.9rem;
-        }}
-        
-        .contact a {{
-            color: #2c5282;
-            text-decoration: none;
-        }}
-        
-        .contact a:hover {{
-            text-decoration: underline;
-        }}
-        
-        section {{
-            margin-bottom: 1.5rem;
-        }}
-        
-        h2 {{
-            font-size: 0.85rem;
-            font-weight: 600;
-            color: #2c5282;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-            margin-bottom: 0.75rem;
-            padding-bottom: 0.25rem;
-            border-bottom: 1px solid #e2e8f0;
-        }}
-        
-        .summary {{
-            text-align: justify;
-            color: #333;
-        }}
-        
-        .job, .education-item {{
-            margin-bottom: 1rem;
-        }}
-        
-        .job h3, .education-item h3 {{
-            font-size: 1rem;
-            font-weight: 600;
-            color: #1a1a1a;
-        }}
-        
-        .dates {{
-            font-size: 0.85rem;
-            color: #666;
-            font-style: italic;
-        }}
-        
-        ul {{
-            margin-left: 1.5rem;
-            margin-top: 0.5rem;
-        }}
-        
-        li {{
-            margin-bottom: 0.25rem;
-            color: #333;
-        }}
-        
-        @media print {{
-            body {{
-                padding: 0;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <header>
-        <h1>{user_info.get('name', '')}</h1>
-        <p class="contact">
-            {user_info.get('email', '')} | {user_info.get('phone', '')} | {user_info.get('location', '')}
-        </p>
-        <p class="contact">
-            <a href="{user_info.get('linkedin', '#')}">LinkedIn</a> | 
-            <a href="{user_info.get('portfolio', '#')}">Portfolio</a>
-        </p>
-    </header>
+        ''' for edu in education)
     
+    header_html = _render_resume_html_header(tuple(sorted(user_info.items())))
+    html_content = f'''{header_html}
     <section>
         <h2>Professional Summary</h2>
         <p class="summary">{tailored_summary}</p>
@@ -729,12 +970,18 @@ def create_resume_html(
 
 # ============== MAIN GENERATION FUNCTIONS ==============
 
+# \W is "not alphanumeric and not underscore", so substituting it with "_"
+# matches a per-character isalnum() check without a Python-level loop
+_UNSAFE_FILENAME_CHAR = re.compile(r'\W')
+
+
 def generate_application_documents(
     job_title: str,
     company: str,
     job_description: str,
     output_format: str = "all",
-    output_dir: Optional[str] = None
+    output_dir: Optional[str] = None,
+    use_cache: bool = True
 ) -> Dict:
     """
     Generate complete application documents (resume + cover letter).
@@ -745,6 +992,7 @@ def generate_application_documents(
         job_description: Full job description
         output_format: "pdf", "docx", "html", or "all"
         output_dir: Directory to save files (defaults to data/applications/)
+        use_cache: Reuse tailored content previously generated for identical inputs
     
     Returns:
         Dict with paths to generated files and content
@@ -758,11 +1006,11 @@ def generate_application_documents(
     # Set output directory
     if not output_dir:
         output_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'applications')
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     
     # Create safe filename
-    safe_company = "".join(c if c.isalnum() else "_" for c in company)
-    safe_title = "".join(c if c.isalnum() else "_" for c in job_title)
+    safe_company = _UNSAFE_FILENAME_CHAR.sub("_", company)
+    safe_title = _UNSAFE_FILENAME_CHAR.sub("_", job_title)
     timestamp = datetime.now().strftime("%Y%m%d")
     base_name = f"{safe_company}_{safe_title}_{timestamp}"
     
@@ -778,13 +1026,27 @@ def generate_application_documents(
     if improvements:
         print(f"  📚 Applying {len(improvements)} learned improvements")
     
+    cache_key = generation_cache_key(resume_text, job_title, company, job_description)
+    
+    def run_tailor():
+        return tailor_resume(resume_text, job_title, company, job_description)
+    
+    def run_cover_letter():
+        return write_cover_letter(resume_text, job_title, company, job_description)
+    
     # Tailor resume
     print("  ⏳ Tailoring resume...")
-    tailored = tailor_resume(resume_text, job_title, company, job_description)
+    tailored = (
+        _cached_call('tailor', cache_key, run_tailor, _is_complete_tailor)
+        if use_cache else run_tailor()
+    )
     
     # Generate cover letter
     print("  ⏳ Writing cover letter...")
-    cover_letter_data = write_cover_letter(resume_text, job_title, company, job_description)
+    cover_letter_data = (
+        _cached_call('cover_letter', cache_key, run_cover_letter, _is_complete_cover_letter)
+        if use_cache else run_cover_letter()
+    )
     
     # Prepare structured data for document generation
     structured_resume = {
@@ -850,31 +1112,40 @@ def generate_application_documents(
         "files": {}
     }
     
-    # Generate requested formats
+    # Generate requested formats. Each writer targets its own file and shares
+    # no mutable state, so the formats are rendered concurrently.
+    tailored_summary = tailored.get('tailored_summary', '')
+    tasks = []
     if output_format in ["pdf", "all"]:
         resume_pdf = os.path.join(output_dir, f"{base_name}_Resume.pdf")
         cover_pdf = os.path.join(output_dir, f"{base_name}_CoverLetter.pdf")
-        
-        if create_resume_pdf(resume_pdf, structured_resume, tailored.get('tailored_summary', ''), skills, experience, education):
-            result["files"]["resume_pdf"] = resume_pdf
-        
-        if create_cover_letter_pdf(cover_pdf, structured_resume, job_title, company, cover_letter_data.get('cover_letter', '')):
-            result["files"]["cover_letter_pdf"] = cover_pdf
+        tasks.append(("resume_pdf", resume_pdf, create_resume_pdf,
+                      (resume_pdf, structured_resume, tailored_summary, skills, experience, education)))
+        tasks.append(("cover_letter_pdf", cover_pdf, create_cover_letter_pdf,
+                      (cover_pdf, structured_resume, job_title, company, cover_letter_data.get('cover_letter', ''))))
     
     if output_format in ["docx", "all"]:
         resume_docx = os.path.join(output_dir, f"{base_name}_Resume.docx")
-        
-        if create_resume_docx(resume_docx, structured_resume, tailored.get('tailored_summary', ''), skills, experience, education):
-            result["files"]["resume_docx"] = resume_docx
+        tasks.append(("resume_docx", resume_docx, create_resume_docx,
+                      (resume_docx, structured_resume, tailored_summary, skills, experience, education)))
     
     if output_format in ["html", "all"]:
         resume_html = os.path.join(output_dir, f"{base_name}_Resume.html")
-        
-        if create_resume_html(resume_html, structured_resume, tailored.get('tailored_summary', ''), skills, experience, education):
-            result["files"]["resume_html"] = resume_html
+        tasks.append(("resume_html", resume_html, create_resume_html,
+                      (resume_html, structured_resume, tailored_summary, skills, experience, education)))
+    
+    if tasks:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [(key, path, executor.submit(writer, *args)) for key, path, writer, args in tasks]
+            for key, path, future in futures:
+                if future.result():
+                    result["files"][key] = path
     
     # Record generation for learning
-    content_hash = str(hash(tailored.get('tailored_summary', '') + cover_letter_data.get('cover_letter', '')))
+    content_digest = hashlib.blake2b(digest_size=16)
+    content_digest.update(tailored.get('tailored_summary', '').encode('utf-8'))
+    content_digest.update(cover_letter_data.get('cover_letter', '').encode('utf-8'))
+    content_hash = content_digest.hexdigest()
     record_generation(
         doc_type="full_application",
         job_title=job_title,
@@ -905,14 +1176,23 @@ def provide_feedback(
         score: 1-10 rating
         feedback: Optional text feedback
     """
-    data = load_learning_data()
-    
     # Find the most recent matching generation
-    for gen in reversed(data["generations"]):
+    for gen in iter_generations_reversed():
+        if gen.get("doc_type") == "feedback":
+            continue
         if gen["job_title"] == job_title and gen["company"] == company:
-            gen["score"] = score
-            gen["feedback"] = feedback
+            # The log is append-only, so feedback is stored as its own record
+            _append_generation_log({
+                "timestamp": datetime.now().isoformat(),
+                "doc_type": "feedback",
+                "job_title": job_title,
+                "company": company,
+                "content_hash": gen.get("content_hash"),
+                "feedback": feedback,
+                "score": score
+            })
             
+            data = load_learning_data()
             if score >= 8:
                 data["successful_patterns"].append({
                     "job_title": job_title,
@@ -926,9 +1206,9 @@ def provide_feedback(
                 })
             
             data["feedback_scores"].append(score)
+            save_learning_data(data)
             break
     
-    save_learning_data(data)
     print(f"✅ Feedback recorded. Thank you for helping me improve!")
 
 
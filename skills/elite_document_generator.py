@@ -13,48 +13,363 @@ import re
 import json
 import yaml
 import hashlib
+import io
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _make_session() -> requests.Session:
+    """Keep-alive session so repeated LLM calls reuse the TLS connection."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return session
+
+
+_GROQ_SESSION = _make_session()
+_OR_SESSION = _make_session()
+
+
+_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
+_config_cache: Optional[Tuple[float, dict]] = None
+_config_lock = threading.Lock()
 
 
 def load_config() -> dict:
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    """Parse config.yaml once; re-read only when the file's mtime changes."""
+    global _config_cache
+    mtime = os.stat(_CONFIG_PATH).st_mtime
+    with _config_lock:
+        if _config_cache is None or _config_cache[0] != mtime:
+            with open(_CONFIG_PATH, 'rb') as f:
+                _config_cache = (mtime, yaml.load(f, Loader=_YamlLoader))
+        return _config_cache[1]
+
+
+def _encode_body(payload: dict) -> bytes:
+    """
+    Serialize a request body as UTF-8 JSON. requests' json= escapes every
+    non-ASCII character (bullets, curly quotes, dashes in job posts) to
+    \\uXXXX, which inflates the body for no benefit.
+    """
+    return _json_dumps(payload).encode('utf-8')
+
+
+# ============== LLM CALLS ==============
+
+# Groq is hedged with OpenRouter once it runs longer than its recent P90
+HEDGE_DEFAULT_SECONDS = 10.0
+HEDGE_MIN_SAMPLES = 10
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_groq_latencies: deque = deque(maxlen=50)
+_latency_lock = threading.Lock()
+
+
+class LLMCancelled(Exception):
+    """Raised inside a request that lost a hedge race."""
+
+
+class _LLMRequest:
+    """
+    Cancellation handle for one in-flight LLM call. Requests are sent with
+    stream=True so the response can be closed by the other thread, which
+    drops the connection instead of downloading the rest of the answer.
+    """
+    
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self._response = None
+        self._lock = threading.Lock()
+    
+    def attach(self, response):
+        with self._lock:
+            self._response = response
+            if self.cancelled.is_set():
+                response.close()
+                raise LLMCancelled()
+        return response
+    
+    def cancel(self):
+        self.cancelled.set()
+        with self._lock:
+            if self._response is not None:
+                self._response.close()
+
+
+def _start_llm_call(fn, *args) -> Future:
+    """
+    Run one LLM call on its own daemon thread. A shared pool would let
+    cancelled losers occupy workers (delaying later calls and triggering
+    needless hedges) and would block interpreter exit until they finish.
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _hedge_delay() -> float:
+    """Seconds to wait on Groq before also asking OpenRouter."""
+    with _latency_lock:
+        samples = sorted(_groq_latencies)
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_SECONDS
+    return samples[int(len(samples) * 0.9)]
+
+
+def _call_groq(prompt: str, llm_config: dict, api_key: str, request: _LLMRequest = None) -> str:
+    request = request or _LLMRequest()
+    started = time.monotonic()
+    try:
+        response = request.attach(_GROQ_SESSION.post(
+            "https://api.groq.com/openai/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json; charset=utf-8",
+            },
+            data=_encode_body({
+                "model": "llama-3.3-70b-versatile",
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": llm_config.get('temperature', 0.3),
+                "max_tokens": llm_config.get('max_tokens', 4096),
+            }),
+            timeout=60,
+            stream=True
+        ))
+        
+        if response.status_code != 200:
+            response.close()
+            raise Exception(f"API error: {response.status_code}")
+        
+        content = response.json()['choices'][0]['message']['content']
+    except Exception:
+        # A cancelled call still ran at least this long: keep it in the
+        # samples so hedging doesn't get more eager every time Groq loses
+        if request.cancelled.is_set():
+            with _latency_lock:
+                _groq_latencies.append(time.monotonic() - started)
+            raise LLMCancelled()
+        raise
+    
+    with _latency_lock:
+        _groq_latencies.append(time.monotonic() - started)
+    return content
+
+
+def _call_openrouter(prompt: str, llm_config: dict, api_key: str, retries: int = 2,
+                     request: _LLMRequest = None) -> str:
+    """OpenRouter is the last resort, so retry rate limits / 5xx with backoff."""
+    request = request or _LLMRequest()
+    for attempt in range(retries + 1):
+        if request.cancelled.is_set():
+            raise LLMCancelled()
+        try:
+            response = request.attach(_OR_SESSION.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json; charset=utf-8",
+                },
+                data=_encode_body({
+                    "model": llm_config.get('model', 'anthropic/claude-3.5-sonnet'),
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": llm_config.get('temperature', 0.3),
+                    "max_tokens": llm_config.get('max_tokens', 4096),
+                }),
+                timeout=60,
+                stream=True
+            ))
+            
+            if response.status_code == 200:
+                return response.json()['choices'][0]['message']['content']
+            error = f"API error: {response.status_code} - {response.text[:200]}"
+        except Exception:
+            if request.cancelled.is_set():
+                raise LLMCancelled()
+            raise
+        if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+            break
+        delay = 2 ** attempt
+        print(f"  ⚠️ OpenRouter API error: {response.status_code}, retrying in {delay}s...")
+        # Wakes early if the call is cancelled while backing off
+        if request.cancelled.wait(delay):
+            raise LLMCancelled()
+    
+    raise Exception(error)
 
 
 def call_llm(prompt: str, config: dict = None) -> str:
-    """Call LLM API - uses Groq as primary, OpenRouter as fallback."""
+    """
+    Call LLM API - uses Groq as primary, OpenRouter as fallback.
+    If Groq is slower than usual, OpenRouter is started alongside it;
+    whichever answers first wins and the other request is cancelled.
+    """
+    if not config:
+        config = load_config()
+    
+    llm_config = config.get('llm', {})
+    groq_key = os.environ.get('GROQ_API_KEY')
+    api_key = os.environ.get('OPENROUTER_API_KEY') or os.environ.get('OpenRouterKey')
+    
+    if not groq_key:
+        if not api_key:
+            raise ValueError("No LLM API key available (GROQ_API_KEY or OPENROUTER_API_KEY)")
+        return _call_openrouter(prompt, llm_config, api_key)
+    
+    # Try Groq first (free tier)
+    if not api_key:
+        try:
+            return _call_groq(prompt, llm_config, groq_key)
+        except Exception as e:
+            print(f"  ⚠️ Groq error: {e}, trying fallback...")
+            raise ValueError("No LLM API key available (GROQ_API_KEY or OPENROUTER_API_KEY)")
+
+    groq_request = _LLMRequest()
+    groq_future = _start_llm_call(_call_groq, prompt, llm_config, groq_key, groq_request)
+    done, _ = wait([groq_future], timeout=_hedge_delay())
+    
+    if done:
+        try:
+            return groq_future.result()
+        except Exception as e:
+            print(f"  ⚠️ Groq error: {e}, trying fallback...")
+        return _call_openrouter(prompt, llm_config, api_key)
+    
+    # Groq is running long - race it against OpenRouter
+    print("  ⏱️ Groq is slow, hedging with OpenRouter...")
+    or_request = _LLMRequest()
+    or_future = _start_llm_call(_call_openrouter, prompt, llm_config, api_key, 2, or_request)
+    requests_by_future = {groq_future: groq_request, or_future: or_request}
+    pending = set(requests_by_future)
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  ⚠️ LLM error: {e}")
+                error = e
+                continue
+            # Cancel the loser so it stops holding a connection (and, for
+            # OpenRouter, stops retrying paid requests)
+            for loser in pending:
+                loser.cancel()
+                requests_by_future[loser].cancel()
+            return result
+    raise error
+
+
+def _iter_sse_content(response) -> Iterator[str]:
+    """Yield delta.content pieces from an OpenAI-style SSE completion stream."""
+    # SSE is always UTF-8, but requests falls back to ISO-8859-1 for a
+    # text/event-stream response without a charset, garbling non-ASCII text
+    response.encoding = 'utf-8'
+    try:
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            try:
+                piece = _json_loads(data)['choices'][0]['delta'].get('content')
+            except (json.JSONDecodeError, KeyError, IndexError):
+                continue
+            if piece:
+                yield piece
+    finally:
+        response.close()
+
+
+def call_llm_stream(prompt: str, config: dict = None, max_tokens: int = None) -> Iterator[str]:
+    """
+    Streaming variant of call_llm - yields content pieces as they arrive.
+    Same Groq-then-OpenRouter fallback; Groq is only abandoned if it fails
+    before producing any output.
+    
+    max_tokens lowers the configured output limit for callers that know
+    their response is small; it never raises it.
+    """
     if not config:
         config = load_config()
     
     llm_config = config.get('llm', {})
+    limit = llm_config.get('max_tokens', 4096)
+    if max_tokens:
+        limit = min(limit, max_tokens)
     
     # Try Groq first (free tier)
     groq_key = os.environ.get('GROQ_API_KEY')
     if groq_key:
+        yielded = False
         try:
-            response = requests.post(
+            response = _GROQ_SESSION.post(
                 "https://api.groq.com/openai/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {groq_key}",
-                    "Content-Type": "application/json",
+                    "Content-Type": "application/json; charset=utf-8",
                 },
-                json={
+                data=_encode_body({
                     "model": "llama-3.3-70b-versatile",
                     "messages": [{"role": "user", "content": prompt}],
                     "temperature": llm_config.get('temperature', 0.3),
-                    "max_tokens": llm_config.get('max_tokens', 4096),
-                },
+                    "max_tokens": limit,
+                    "stream": True,
+                }),
+                stream=True,
                 timeout=60
             )
             
             if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content']
+                for piece in _iter_sse_content(response):
+                    yielded = True
+                    yield piece
+                return
             else:
+                response.close()
                 print(f"  ⚠️ Groq API error: {response.status_code}, trying fallback...")
         except Exception as e:
+            if yielded:
+                raise
             print(f"  ⚠️ Groq error: {e}, trying fallback...")
     
     # Fallback to OpenRouter
@@ -62,34 +377,155 @@ def call_llm(prompt: str, config: dict = None) -> str:
     if not api_key:
         raise ValueError("No LLM API key available (GROQ_API_KEY or OPENROUTER_API_KEY)")
     
-    response = requests.post(
+    response = _OR_SESSION.post(
         "https://openrouter.ai/api/v1/chat/completions",
         headers={
             "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
+            "Content-Type": "application/json; charset=utf-8",
         },
-        json={
+        data=_encode_body({
             "model": llm_config.get('model', 'anthropic/claude-3.5-sonnet'),
             "messages": [{"role": "user", "content": prompt}],
             "temperature": llm_config.get('temperature', 0.3),
-            "max_tokens": llm_config.get('max_tokens', 4096),
-        },
+            "max_tokens": limit,
+            "stream": True,
+        }),
+        stream=True,
         timeout=60
     )
     
     if response.status_code != 200:
         raise Exception(f"API error: {response.status_code} - {response.text[:200]}")
     
-    return response.json()['choices'][0]['message']['content']
+    yield from _iter_sse_content(response)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_json(text: str, opener: str):
+    """
+    Decode the first complete JSON value starting at `opener`, ignoring any
+    prose the model wrote before or after it.
+    """
+    start = text.find(opener)
+    if start < 0:
+        raise json.JSONDecodeError("No JSON found", text, 0)
+    obj, _end = _JSON_DECODER.raw_decode(text, start)
+    return obj
+
+
+class JSONStreamAccumulator:
+    """
+    Collects streamed text pieces and parses the embedded JSON value.
+    Pieces are kept in a list and joined only when a parse is attempted,
+    so accumulation stays linear in the response size.
+    """
+    
+    def __init__(self, opener: str = '{', closer: str = '}'):
+        self.opener = opener
+        self.closer = closer
+        self._chunks: List[str] = []
+    
+    def append(self, chunk: str) -> None:
+        self._chunks.append(chunk)
+    
+    def text(self) -> str:
+        return "".join(self._chunks)
+    
+    def maybe_parse(self):
+        """Parse if the last piece could close the JSON value, else None."""
+        if not self._chunks or not self._chunks[-1].rstrip().endswith(self.closer):
+            return None
+        return self.parse()
+    
+    def parse(self):
+        """Parse whatever has been accumulated; None if it isn't valid JSON."""
+        try:
+            return _decode_json(self.text(), self.opener)
+        except json.JSONDecodeError:
+            return None
+
+
+def call_llm_json(
+    prompt: str,
+    config: dict = None,
+    opener: str = '{',
+    closer: str = '}',
+    max_tokens: int = None
+):
+    """
+    Stream a completion and return the parsed JSON value as soon as it is
+    complete, without waiting for any trailing prose. Returns None if the
+    response never contains valid JSON.
+    """
+    acc = JSONStreamAccumulator(opener, closer)
+    stream = call_llm_stream(prompt, config, max_tokens)
+    try:
+        for piece in stream:
+            acc.append(piece)
+            data = acc.maybe_parse()
+            if data is not None:
+                return data
+    finally:
+        stream.close()
+    
+    return acc.parse()
 
 
 # ============== STEP 1: JOB DESCRIPTION INTELLIGENCE ==============
 
+# Output budgets for the JSON-returning prompts (capped by config max_tokens)
+KEYWORD_MAX_TOKENS = 1024
+BULLET_TOKENS_PER_ROLE = 350
+
+
+def get_keyword_cache_dir() -> str:
+    """Get the directory holding cached keyword extractions."""
+    return os.path.join(os.path.dirname(__file__), '..', 'data', 'keyword_cache')
+
+
+def _keyword_cache_path(job_description: str, job_title: str) -> str:
+    key = hashlib.blake2b(
+        f"{job_title}\0{job_description}".encode('utf-8'), digest_size=16
+    ).hexdigest()
+    return os.path.join(get_keyword_cache_dir(), f"{key}.json")
+
+
 def extract_job_keywords(job_description: str, job_title: str = "") -> Dict:
     """
     Extract 15-20 exact keywords from job description for ATS optimization.
     Captures exact terminology - NO synonyms.
+    
+    Results are cached on disk per (job_title, job_description); set
+    CLAWDBOT_NO_CACHE=1 to always call the LLM.
     """
+    use_cache = not os.environ.get('CLAWDBOT_NO_CACHE')
+    cache_path = _keyword_cache_path(job_description, job_title)
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+    
+    keywords = _extract_job_keywords_llm(job_description, job_title)
+    
+    # Don't cache the empty fallback - a later run may get a usable response
+    if use_cache and keywords.get('all_keywords'):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(keywords))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"  ⚠️ Could not cache keywords: {e}")
+    
+    return keywords
+
+
+def _extract_job_keywords_llm(job_description: str, job_title: str) -> Dict:
     config = load_config()
     
     prompt = f"""You are an ATS (Applicant Tracking System) optimization expert.
@@ -141,26 +577,28 @@ Respond in JSON format ONLY:
 IMPORTANT: Use EXACT terminology from the job posting. Do not substitute synonyms.
 For example, use "Adobe Creative Suite" if that's what they wrote, NOT "Adobe CC"."""
 
-    response = call_llm(prompt, config)
-    
-    try:
-        start = response.find('{')
-        end = response.rfind('}') + 1
-        if start >= 0 and end > start:
-            data = json.loads(response[start:end])
-            # Compile all keywords
-            all_kw = (
-                data.get('hard_skills', []) +
-                data.get('soft_skills', []) +
-                data.get('required_qualifications', []) +
-                data.get('action_verbs', []) +
-                data.get('industry_terms', [])
-            )
-            data['all_keywords'] = list(set(all_kw))
-            return data
-    except json.JSONDecodeError:
-        pass
+    # The keyword schema is small; don't reserve the full output budget
+    data = call_llm_json(prompt, config, max_tokens=KEYWORD_MAX_TOKENS)
+    if isinstance(data, dict):
+        return _compile_keywords(data)
     
+    return _empty_keywords()
+
+
+def _compile_keywords(data: Dict) -> Dict:
+    """Fill in all_keywords from the individual keyword categories."""
+    all_kw = (
+        data.get('hard_skills', []) +
+        data.get('soft_skills', []) +
+        data.get('required_qualifications', []) +
+        data.get('action_verbs', []) +
+        data.get('industry_terms', [])
+    )
+    data['all_keywords'] = list(set(all_kw))
+    return data
+
+
+def _empty_keywords() -> Dict:
     return {
         "hard_skills": [],
         "soft_skills": [],
@@ -176,47 +614,80 @@ For example, use "Adobe Creative Suite" if that's what they wrote, NOT "Adobe CC
 
 # ============== STEP 2: KEYWORD MATCH SCORING ==============
 
-def calculate_keyword_match(resume_text: str, keywords: Dict) -> Dict:
+# Resume text can be passed as one string or as pieces (e.g. resume + new
+# summary) that are scanned separately instead of being concatenated
+TextParts = Union[str, Sequence[str]]
+
+
+def _as_parts(text: TextParts) -> List[str]:
+    return [text] if isinstance(text, str) else list(text)
+
+
+def calculate_keyword_match(
+    resume_text: TextParts,
+    keywords: Dict,
+    resume_lower: Optional[TextParts] = None
+) -> Dict:
     """
     Calculate ATS keyword match rate.
     Target: 75%+ for optimal ATS pass rate.
-    """
-    resume_lower = resume_text.lower()
     
-    results = {
-        "hard_skills": {"matched": [], "missing": [], "score": 0},
-        "soft_skills": {"matched": [], "missing": [], "score": 0},
-        "required": {"matched": [], "missing": [], "score": 0},
-        "action_verbs": {"matched": [], "missing": [], "score": 0},
-    }
+    resume_text may be a list of pieces; a keyword matches if it occurs in
+    any of them. Pass resume_lower if the caller already has the lowercased
+    text (same shape as resume_text).
+    """
+    if resume_lower is None:
+        lowers = [part.lower() for part in _as_parts(resume_text)]
+    else:
+        lowers = _as_parts(resume_lower)
     
-    # Check each category
-    for category, kw_list in [
+    categories = [
         ("hard_skills", keywords.get("hard_skills", [])),
         ("soft_skills", keywords.get("soft_skills", [])),
         ("required", keywords.get("required_qualifications", [])),
         ("action_verbs", keywords.get("action_verbs", [])),
-    ]:
-        matched = []
-        missing = []
-        for kw in kw_list:
-            if kw.lower() in resume_lower:
-                matched.append(kw)
+    ]
+    all_keywords = keywords.get("all_keywords", [])
+    
+    # Index each distinct lowercased keyword to every (category, position) it
+    # occupies, so each one is looked up once no matter how many lists share it
+    kw_index: Dict[str, List[Tuple[str, int]]] = {}
+    for category, kw_list in categories:
+        for pos, kw in enumerate(kw_list):
+            kw_index.setdefault(kw.lower(), []).append((category, pos))
+    for pos, kw in enumerate(all_keywords):
+        kw_index.setdefault(kw.lower(), []).append(("all", pos))
+    
+    # One pass over the resume finds every keyword from every category
+    found = _find_keywords(lowers, kw_index.keys())
+    
+    hits = {category: [False] * len(kw_list) for category, kw_list in categories}
+    # Keyword density check (15-25 keywords naturally integrated)
+    total_matched = 0
+    for kw, slots in kw_index.items():
+        if kw not in found:
+            continue
+        for category, pos in slots:
+            if category == "all":
+                total_matched += 1
             else:
-                missing.append(kw)
-        
-        results[category]["matched"] = matched
-        results[category]["missing"] = missing
-        results[category]["score"] = len(matched) / len(kw_list) * 100 if kw_list else 100
+                hits[category][pos] = True
+    
+    results = {}
+    for category, kw_list in categories:
+        flags = hits[category]
+        matched = [kw for kw, hit in zip(kw_list, flags) if hit]
+        missing = [kw for kw, hit in zip(kw_list, flags) if not hit]
+        results[category] = {
+            "matched": matched,
+            "missing": missing,
+            "score": len(matched) / len(kw_list) * 100 if kw_list else 100,
+        }
     
     # Calculate overall weighted score
     weights = {"hard_skills": 0.4, "required": 0.35, "soft_skills": 0.15, "action_verbs": 0.1}
     overall = sum(results[cat]["score"] * weight for cat, weight in weights.items())
     
-    # Keyword density check (15-25 keywords naturally integrated)
-    all_keywords = keywords.get("all_keywords", [])
-    total_matched = sum(1 for kw in all_keywords if kw.lower() in resume_lower)
-    
     return {
         "overall_match_rate": round(overall, 1),
         "ats_pass_likelihood": "HIGH" if overall >= 75 else "MEDIUM" if overall >= 50 else "LOW",
@@ -227,6 +698,28 @@ def calculate_keyword_match(resume_text: str, keywords: Dict) -> Dict:
     }
 
 
+def _find_keywords(texts_lower: List[str], keywords_lower) -> set:
+    """
+    Return the subset of keywords_lower that occur as substrings of any of
+    texts_lower. Uses one Aho-Corasick sweep per text when pyahocorasick is
+    installed, otherwise one substring scan per keyword.
+    """
+    if not AHOCORASICK_AVAILABLE or not keywords_lower:
+        return {kw for kw in keywords_lower if any(kw in text for text in texts_lower)}
+    
+    automaton = ahocorasick.Automaton()
+    for kw in keywords_lower:
+        if kw:
+            automaton.add_word(kw, kw)
+    # "" is a substring of everything, same as the `in` check
+    found = {""} if "" in keywords_lower else set()
+    if len(automaton):
+        automaton.make_automaton()
+        for text in texts_lower:
+            found.update(kw for _, kw in automaton.iter(text))
+    return found
+
+
 def generate_match_recommendations(results: Dict, overall: float) -> List[str]:
     """Generate actionable recommendations to improve match rate."""
     recs = []
@@ -303,7 +796,7 @@ def generate_elite_bullets(
     prompt = f"""Transform these experience bullet points to be ATS-optimized.
 
 CURRENT EXPERIENCE:
-{json.dumps(experience, indent=2)}
+{_json_dumps(experience)}
 
 USE THESE ACTION VERBS (from job posting):
 {', '.join(action_verbs)}
@@ -327,15 +820,11 @@ EXAMPLES OF GOOD BULLETS:
 Return improved experience in JSON format:
 [{{"title": "...", "company": "...", "dates": "...", "bullets": ["...", "..."]}}]"""
 
-    response = call_llm(prompt, config)
-    
-    try:
-        start = response.find('[')
-        end = response.rfind(']') + 1
-        if start >= 0 and end > start:
-            return json.loads(response[start:end])
-    except json.JSONDecodeError:
-        pass
+    bullets = call_llm_json(
+        prompt, config, '[', ']', max_tokens=len(experience) * BULLET_TOKENS_PER_ROLE
+    )
+    if isinstance(bullets, list):
+        return bullets
     
     return experience
 
@@ -424,16 +913,31 @@ Best regards,
 
 # ============== STEP 5: QUALITY ASSURANCE ==============
 
+_ATS_SECTIONS_RE = re.compile(r"EXPERIENCE|SKILLS|EDUCATION", re.I)
+_QUANT_RE = re.compile(r"[%$]|increased|reduced|improved")
+_CTA_RE = re.compile(r"look forward|opportunity to discuss|available", re.I)
+_DIGIT_RE = re.compile(r"\d")
+
+
 def validate_documents(
-    resume_text: str,
+    resume_text: TextParts,
     cover_letter: str,
     keywords: Dict,
     job_title: str,
-    company: str
+    company: str,
+    precomputed_match: Dict = None,
+    resume_lower: Optional[TextParts] = None
 ) -> Dict:
     """
     Quality assurance validation against 2025 best practices.
+    resume_text may be a list of pieces, as for calculate_keyword_match.
+    Pass precomputed_match (a calculate_keyword_match result for resume_text)
+    to skip re-scoring the resume, or resume_lower to skip re-lowercasing it.
     """
+    match = precomputed_match or calculate_keyword_match(resume_text, keywords, resume_lower)
+    parts = _as_parts(resume_text)
+    cl_lower = cover_letter.lower()
+    
     checks = {
         "ats_compatibility": [],
         "human_readability": [],
@@ -446,10 +950,10 @@ def validate_documents(
     
     # ATS Compatibility Checks
     ats_checks = [
-        ("Keywords present (75%+)", calculate_keyword_match(resume_text, keywords)["overall_match_rate"] >= 75),
+        ("Keywords present (75%+)", match["overall_match_rate"] >= 75),
         ("No tables/graphics", True),  # Our generator doesn't use these
-        ("Standard sections", any(s in resume_text.upper() for s in ["EXPERIENCE", "SKILLS", "EDUCATION"])),
-        ("Contact info present", "@" in resume_text and any(c.isdigit() for c in resume_text)),
+        ("Standard sections", any(_ATS_SECTIONS_RE.search(p) for p in parts)),
+        ("Contact info present", any("@" in p for p in parts) and any(_DIGIT_RE.search(p) for p in parts)),
     ]
     
     for check_name, passed in ats_checks:
@@ -462,9 +966,9 @@ def validate_documents(
     
     # Content Quality Checks
     content_checks = [
-        ("Has quantified achievements", any(c in resume_text for c in ['%', '$', 'increased', 'reduced', 'improved'])),
-        ("Company name correct", company.lower() in cover_letter.lower()),
-        ("Job title mentioned", job_title.lower() in cover_letter.lower()),
+        ("Has quantified achievements", any(_QUANT_RE.search(p) for p in parts)),
+        ("Company name correct", company.lower() in cl_lower),
+        ("Job title mentioned", job_title.lower() in cl_lower),
     ]
     
     for check_name, passed in content_checks:
@@ -479,8 +983,8 @@ def validate_documents(
     word_count = len(cover_letter.split())
     cl_checks = [
         ("Word count 250-400", 200 <= word_count <= 450),
-        ("Has call to action", any(phrase in cover_letter.lower() for phrase in ["look forward", "opportunity to discuss", "available"])),
-        ("No generic openers", not cover_letter.lower().startswith("i am writing to")),
+        ("Has call to action", _CTA_RE.search(cover_letter) is not None),
+        ("No generic openers", not cl_lower.startswith("i am writing to")),
     ]
     
     for check_name, passed in cl_checks:
@@ -514,12 +1018,17 @@ def generate_elite_application(
     config = load_config()
     user = config['user']
     
+    # Keyword extraction only needs the job posting, so start it now and let
+    # the LLM round trip overlap with loading the resume
+    keyword_pool = ThreadPoolExecutor(max_workers=1)
+    keywords_future = keyword_pool.submit(extract_job_keywords, job_description, job_title)
+    keyword_pool.shutdown(wait=False)
+    
     # Load base resume if not provided
     if not resume_text:
-        resume_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'base_resume.txt')
-        if os.path.exists(resume_path):
-            with open(resume_path, 'r') as f:
-                resume_text = f.read()
+        resume_path = Path(__file__).parent.parent / 'data' / 'base_resume.txt'
+        if resume_path.exists():
+            resume_text = resume_path.read_text(encoding='utf-8')
         else:
             resume_text = f"""
 {user['name']}
@@ -543,34 +1052,45 @@ EXPERIENCE
     
     # Step 1: Extract keywords
     print("\n📊 Step 1: Extracting keywords from job description...")
-    keywords = extract_job_keywords(job_description, job_title)
+    keywords = keywords_future.result()
     print(f"   Found {len(keywords.get('all_keywords', []))} keywords")
     print(f"   Hard skills: {', '.join(keywords.get('hard_skills', [])[:5])}")
     
     # Step 2: Calculate initial match
     print("\n📈 Step 2: Calculating initial match score...")
-    initial_match = calculate_keyword_match(resume_text, keywords)
+    resume_lower = resume_text.lower()
+    initial_match = calculate_keyword_match(resume_text, keywords, resume_lower)
     print(f"   Initial match rate: {initial_match['overall_match_rate']}%")
     print(f"   ATS pass likelihood: {initial_match['ats_pass_likelihood']}")
     
-    # Step 3: Generate elite summary
+    # Steps 3 & 4: Summary and cover letter only depend on keywords + resume,
+    # so issue both LLM calls at once instead of waiting on each in turn
     print("\n✍️ Step 3: Generating ATS-optimized summary...")
-    elite_summary = generate_elite_summary(resume_text, job_title, company, keywords, config)
-    
-    # Step 4: Generate elite cover letter
     print("\n📝 Step 4: Writing problem-solution cover letter...")
-    elite_cover_letter = generate_elite_cover_letter(
-        resume_text, job_title, company, job_description, keywords, user['name'], config
-    )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        summary_future = pool.submit(
+            generate_elite_summary, resume_text, job_title, company, keywords, config
+        )
+        cover_letter_future = pool.submit(
+            generate_elite_cover_letter,
+            resume_text, job_title, company, job_description, keywords, user['name'], config
+        )
+        elite_summary = summary_future.result()
+        elite_cover_letter = cover_letter_future.result()
     
     # Step 5: Calculate final match (with new summary)
-    combined_text = f"{resume_text}\n{elite_summary}"
-    final_match = calculate_keyword_match(combined_text, keywords)
+    # Scored as separate pieces rather than one concatenated copy
+    combined_parts = [resume_text, elite_summary]
+    combined_lower = [resume_lower, elite_summary.lower()]
+    final_match = calculate_keyword_match(combined_parts, keywords, combined_lower)
     print(f"\n📊 Final match rate: {final_match['overall_match_rate']}%")
     
     # Step 6: Quality validation
     print("\n✅ Step 6: Running quality assurance...")
-    validation = validate_documents(combined_text, elite_cover_letter, keywords, job_title, company)
+    validation = validate_documents(
+        combined_parts, elite_cover_letter, keywords, job_title, company,
+        final_match, combined_lower
+    )
     print(f"   QA Score: {validation['overall_score']}")
     print(f"   Ready to submit: {'Yes ✅' if validation['ready_to_submit'] else 'Needs review ⚠️'}")
     
@@ -602,32 +1122,32 @@ EXPERIENCE
 
 def generate_match_report(result: Dict) -> str:
     """Generate a printable keyword match report."""
-    report = []
-    report.append("=" * 60)
-    report.append("KEYWORD MATCH REPORT")
-    report.append("=" * 60)
-    report.append(f"Position: {result['job_title']} at {result['company']}")
-    report.append(f"Generated: {result['generated_at']}")
-    report.append("")
-    
+    buf = io.StringIO()
+    w = buf.write
+    rule = "=" * 60
     match = result['final_match']
-    report.append(f"OVERALL MATCH RATE: {match['overall_match_rate']}%")
-    report.append(f"ATS PASS LIKELIHOOD: {match['ats_pass_likelihood']}")
-    report.append(f"Keywords Matched: {match['total_keywords_matched']}/{match['total_keywords']}")
-    report.append("")
     
-    report.append("CATEGORY BREAKDOWN:")
+    w(f"{rule}\nKEYWORD MATCH REPORT\n{rule}\n")
+    w(f"Position: {result['job_title']} at {result['company']}\n")
+    w(f"Generated: {result['generated_at']}\n\n")
+    
+    w(f"OVERALL MATCH RATE: {match['overall_match_rate']}%\n")
+    w(f"ATS PASS LIKELIHOOD: {match['ats_pass_likelihood']}\n")
+    w(f"Keywords Matched: {match['total_keywords_matched']}/{match['total_keywords']}\n\n")
+    
+    w("CATEGORY BREAKDOWN:\n")
     for cat, data in match['categories'].items():
-        report.append(f"  {cat.replace('_', ' ').title()}: {data['score']:.0f}%")
-        if data['missing']:
-            report.append(f"    Missing: {', '.join(data['missing'][:3])}")
+        score = data['score']
+        missing = data['missing']
+        w(f"  {cat.replace('_', ' ').title()}: {score:.0f}%\n")
+        if missing:
+            w(f"    Missing: {', '.join(missing[:3])}\n")
     
-    report.append("")
-    report.append("RECOMMENDATIONS:")
+    w("\nRECOMMENDATIONS:")
     for rec in match.get('recommendations', []):
-        report.append(f"  • {rec}")
+        w(f"\n  • {rec}")
     
-    return "\n".join(report)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,16 @@ Enhanced Resume & Cover Letter Generation Prompts
 ==================================================
 Human-authentic, ATS-optimized prompts with anti-AI language validation.
 """
+import hashlib
+import re
+from collections import Counter
+from functools import lru_cache
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Banned AI-style phrases that reveal AI origin
 BANNED_PHRASES = [
@@ -28,6 +38,54 @@ BUZZWORDS_TO_AVOID = [
 ]
 
 
+# Overly formal AI patterns
+FORMAL_PATTERNS = [
+    "in order to", "it is important to note", "it should be noted",
+    "one of the key", "a wide range of", "a variety of",
+    "significant experience", "extensive experience", "proven ability"
+]
+
+# Banned phrases that cost more points than the rest
+CRITICAL_PHRASES = frozenset({"proven track record", "leveraged"})
+
+# First word of each sentence: the first run of non-space, non-period
+# characters at the start of the text or after a '.'
+_SENTENCE_START_RE = re.compile(r'(?:^|\.)\s*([^\s.]+)')
+
+# Every phrase validate_document looks for, lowercased
+_PHRASE_SET = frozenset(
+    p.lower() for p in BANNED_PHRASES + BUZZWORDS_TO_AVOID + FORMAL_PATTERNS
+)
+
+
+def _build_phrase_automaton():
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in _PHRASE_SET:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import; lets validate_document find every phrase in one pass
+_PHRASE_AUTOMATON = _build_phrase_automaton()
+
+
+def _find_phrases(text_lower: str) -> set:
+    """Return the lowercased phrases from _PHRASE_SET that occur in text_lower."""
+    if _PHRASE_AUTOMATON is None:
+        return {p for p in _PHRASE_SET if p in text_lower}
+    return {phrase for _, phrase in _PHRASE_AUTOMATON.iter(text_lower)}
+
+
+@lru_cache(maxsize=128)
+def _joined(parts: tuple, sep: str, prefix: str = "") -> str:
+    """sep.join of prefixed parts, cached - callers in a batch reuse the same lists."""
+    return sep.join(prefix + part for part in parts) if prefix else sep.join(parts)
+
+
+@lru_cache(maxsize=256)
 def get_job_analysis_prompt(job_description: str, job_title: str) -> str:
     """Generate prompt for analyzing job requirements."""
     return f"""Analyze this job posting and extract the core requirements.
@@ -58,8 +116,18 @@ def get_resume_summary_prompt(
     key_requirements: list
 ) -> str:
     """Generate prompt for human-authentic resume summary."""
-    requirements_str = ", ".join(key_requirements[:5])
-    
+    return _resume_summary_prompt(
+        candidate_profile, job_title, company, _joined(tuple(key_requirements[:5]), ", ")
+    )
+
+
+@lru_cache(maxsize=256)
+def _resume_summary_prompt(
+    candidate_profile: str,
+    job_title: str,
+    company: str,
+    requirements_str: str
+) -> str:
     return f"""Write a professional summary for a resume applying to {job_title} at {company}.
 
 CANDIDATE BACKGROUND:
@@ -92,8 +160,13 @@ def get_experience_bullet_prompt(
     company_context: str
 ) -> str:
     """Generate prompt for rewriting experience bullets."""
-    keywords_str = ", ".join(job_keywords[:8])
-    
+    return _experience_bullet_prompt(
+        original_bullet, _joined(tuple(job_keywords[:8]), ", "), company_context
+    )
+
+
+@lru_cache(maxsize=256)
+def _experience_bullet_prompt(original_bullet: str, keywords_str: str, company_context: str) -> str:
     return f"""Rewrite this resume bullet point to be more impactful and ATS-friendly.
 
 ORIGINAL: {original_bullet}
@@ -125,8 +198,46 @@ def get_cover_letter_prompt(
     specific_achievements: list
 ) -> str:
     """Generate prompt for human-authentic cover letter."""
-    achievements_str = "\n".join([f"- {a}" for a in specific_achievements[:3]])
-    
+    achievements_str = _joined(tuple(specific_achievements[:3]), "\n", "- ")
+    return _cover_letter_prompt(
+        candidate_profile, job_title, company, job_description[:1500], achievements_str
+    )
+
+
+def prompt_cache_key(*parts: str) -> bytes:
+    """
+    Stable 16-byte key for a prompt's inputs, for local response caches.
+    Whitespace is collapsed first so trivially different inputs share a key.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(' '.join(part.split()).encode('utf-8'))
+        h.update(b'\0')  # Separator: ("ab", "c") and ("a", "bc") differ
+    return h.digest()
+
+
+def get_cover_letter_cache_key(
+    candidate_profile: str,
+    job_title: str,
+    company: str,
+    job_description: str,
+    specific_achievements: list
+) -> bytes:
+    """Cache key covering the inputs get_cover_letter_prompt puts in the prompt."""
+    return prompt_cache_key(
+        candidate_profile, job_title, company, job_description[:1500],
+        _joined(tuple(specific_achievements[:3]), "\n", "- ")
+    )
+
+
+@lru_cache(maxsize=256)
+def _cover_letter_prompt(
+    candidate_profile: str,
+    job_title: str,
+    company: str,
+    job_description_summary: str,
+    achievements_str: str
+) -> str:
     return f"""Write a cover letter for {job_title} at {company}.
 
 CANDIDATE PROFILE:
@@ -136,7 +247,7 @@ CANDIDATE'S KEY ACHIEVEMENTS:
 {achievements_str}
 
 JOB DESCRIPTION SUMMARY:
-{job_description[:1500]}
+{job_description_summary}
 
 STRICT REQUIREMENTS:
 
@@ -181,55 +292,65 @@ def validate_document(text: str) -> dict:
     Validate generated document for AI-tells and quality.
     Returns dict with score and issues found.
     """
+    score, issues = _validate_text(text)
+    return {
+        "score": score,
+        "passed": score >= 70,  # Lower threshold since base resume may have some phrases
+        "issues": list(issues),
+        "issue_count": len(issues)
+    }
+
+
+@lru_cache(maxsize=256)
+def _validate_text(text: str) -> tuple:
+    """
+    Score a document; returns (score, issues tuple).
+    Cached so re-validating the same text (retries, unchanged edits) is a lookup.
+    """
     issues = []
+    # Issues are tallied by severity as they are added
+    counts = Counter()
     text_lower = text.lower()
+    found = _find_phrases(text_lower)
     
     # Check for banned phrases
     for phrase in BANNED_PHRASES:
-        if phrase.lower() in text_lower:
+        phrase_lower = phrase.lower()
+        if phrase_lower in found:
             issues.append(f"AI-tell phrase found: '{phrase}'")
+            counts['critical' if phrase_lower in CRITICAL_PHRASES else 'minor'] += 1
     
     # Check for buzzwords
-    buzzword_count = 0
-    for word in BUZZWORDS_TO_AVOID:
-        if word.lower() in text_lower:
-            buzzword_count += 1
+    buzzword_count = sum(1 for word in BUZZWORDS_TO_AVOID if word.lower() in found)
     if buzzword_count > 2:
         issues.append(f"Too many generic buzzwords: {buzzword_count} found")
+        counts['minor'] += 1
     
-    # Check for repetitive patterns
-    sentences = text.split('.')
-    if len(sentences) > 3:
-        starts = [s.strip().split()[0].lower() for s in sentences if s.strip() and len(s.strip().split()) > 0]
-        if len(starts) != len(set(starts)):
-            issues.append("Repetitive sentence structure detected")
+    # Check for repetitive patterns (first word of each '.'-separated sentence)
+    if text.count('.') >= 3:
+        # Stop at the first opener seen twice; one repeat is enough to flag
+        seen = set()
+        for m in _SENTENCE_START_RE.finditer(text):
+            word = m.group(1).lower()
+            if word in seen:
+                issues.append("Repetitive sentence structure detected")
+                counts['minor'] += 1
+                break
+            seen.add(word)
     
     # Check for overly formal AI patterns
-    formal_patterns = [
-        "in order to", "it is important to note", "it should be noted",
-        "one of the key", "a wide range of", "a variety of",
-        "significant experience", "extensive experience", "proven ability"
-    ]
-    for pattern in formal_patterns:
-        if pattern in text_lower:
+    for pattern in FORMAL_PATTERNS:
+        if pattern in found:
             issues.append(f"Overly formal pattern: '{pattern}'")
+            counts['minor'] += 1
     
     # Calculate score - less harsh penalties for minor issues
     base_score = 100
     
-    # Count critical vs minor issues
-    critical_count = sum(1 for i in issues if 'proven track record' in i.lower() or 'leveraged' in i.lower())
-    minor_count = len(issues) - critical_count
-    
-    penalty = (critical_count * 15) + (minor_count * 5)
+    penalty = (counts['critical'] * 15) + (counts['minor'] * 5)
     score = max(0, base_score - penalty)
     
-    return {
-        "score": score,
-        "passed": score >= 70,  # Lower threshold since base resume may have some phrases
-        "issues": issues,
-        "issue_count": len(issues)
-    }
+    return score, tuple(issues)
 
 
 def get_confidence_score(resume_validation: dict, cover_letter_validation: dict, job_alignment: float) -> dict:
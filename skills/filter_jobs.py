@@ -5,14 +5,84 @@ import os
 import re
 import yaml
 import pandas as pd
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, FrozenSet
+from urllib.parse import urlsplit
+
+
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> dict:
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def load_config() -> dict:
-    """Load configuration from config.yaml"""
+    """
+    Load configuration from config.yaml.
+    Parsed once per file version (keyed on mtime); treat the result as read-only.
+    """
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config.yaml')
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return _load_config_cached(config_path, os.stat(config_path).st_mtime_ns)
+
+
+# Patterns for unrealistic pay
+UNREALISTIC_PAY_PATTERNS = [
+    r'\$\d{4,}\s*/?\s*(?:day|daily)',  # $1000+/day
+    r'\$\d{5,}\s*/?\s*(?:week|weekly)',  # $10000+/week
+    r'guaranteed.*\$\d{4,}',
+    r'earn.*\$\d{4,}.*easily',
+    r'make.*\$\d{4,}.*from home',
+]
+# One pass over the text instead of one search per pattern
+_UNREALISTIC_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in UNREALISTIC_PAY_PATTERNS), re.IGNORECASE
+)
+
+# Suspicious company names
+SUSPICIOUS_COMPANY_NAMES = [
+    'confidential',
+    'anonymous',
+    'undisclosed',
+    'private company',
+    'hiring now',
+    'urgent hiring',
+]
+
+# Category-specific relevance keywords (lowercase, built once at import)
+CATEGORY_KEYWORDS = {
+    'graphic_design': ('graphic', 'visual', 'design', 'creative', 'brand', 'adobe', 'photoshop', 'illustrator'),
+    'multimedia': ('video', 'motion', 'animation', 'after effects', 'premiere', 'multimedia', '3d'),
+    'administrative': ('admin', 'assistant', 'office', 'clerical', 'receptionist', 'scheduling', 'calendar'),
+    'cannabis': ('cannabis', 'dispensary', 'budtender', 'marijuana', 'thc', 'cbd'),
+}
+
+
+@lru_cache(maxsize=32)
+def _prepare_terms(terms: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Optional[re.Pattern]]:
+    """
+    Lowercase a static term list once and compile it into one literal
+    alternation for fast any-match checks against lowercased text.
+    """
+    lowered = tuple(term.lower() for term in terms)
+    if not lowered:
+        return lowered, None
+    return lowered, re.compile('|'.join(re.escape(term) for term in lowered))
+
+
+def scam_hit(text: str, scam_keywords: List[str]) -> bool:
+    """Fast path: True if text contains any scam keyword (stops at the first hit)."""
+    _, pattern = _prepare_terms(tuple(scam_keywords))
+    return pattern is not None and pattern.search(text.lower()) is not None
+
+
+def scam_matches(text: str, scam_keywords: List[str]) -> List[str]:
+    """All scam keywords found in text, in config order."""
+    lowered, _ = _prepare_terms(tuple(scam_keywords))
+    text_lower = text.lower()
+    return [kw for kw, kw_lower in zip(scam_keywords, lowered) if kw_lower in text_lower]
 
 
 def check_scam_keywords(text: str, scam_keywords: List[str]) -> Tuple[bool, List[str]]:
@@ -22,11 +92,13 @@ def check_scam_keywords(text: str, scam_keywords: List[str]) -> Tuple[bool, List
     Returns:
         Tuple of (is_scam, list of matched keywords)
     """
-    if not text or pd.isna(text):
+    if not text:
         return False, []
     
-    text_lower = text.lower()
-    matched = [kw for kw in scam_keywords if kw.lower() in text_lower]
+    # Most jobs are clean, so only list the matches once something hit
+    if not scam_hit(text, scam_keywords):
+        return False, []
+    matched = scam_matches(text, scam_keywords)
     
     return len(matched) > 0, matched
 
@@ -35,56 +107,60 @@ def check_unrealistic_pay(description: str) -> bool:
     """
     Check for unrealistic pay claims that indicate scam.
     """
-    if not description or pd.isna(description):
+    if not description:
         return False
     
-    # Patterns for unrealistic pay
-    unrealistic_patterns = [
-        r'\$\d{4,}\s*/?\s*(day|daily)',  # $1000+/day
-        r'\$\d{5,}\s*/?\s*(week|weekly)',  # $10000+/week
-        r'guaranteed.*\$\d{4,}',
-        r'earn.*\$\d{4,}.*easily',
-        r'make.*\$\d{4,}.*from home',
-    ]
-    
-    for pattern in unrealistic_patterns:
-        if re.search(pattern, description.lower()):
-            return True
-    
-    return False
+    return _UNREALISTIC_RE.search(description) is not None
+
+
+@lru_cache(maxsize=8)
+def _trusted_hosts(trusted_domains: Tuple[str, ...]) -> FrozenSet[str]:
+    """Trusted domains as bare lowercase hostnames ('www.' and leading dots removed)."""
+    hosts = set()
+    for domain in trusted_domains:
+        host = domain.strip().lower().lstrip('.')
+        hosts.add(host[4:] if host.startswith('www.') else host)
+    return frozenset(hosts)
+
+
+def _url_host(job_url: str) -> str:
+    """Lowercase hostname of a job URL; scheme-less URLs like 'indeed.com/x' work too."""
+    try:
+        host = urlsplit(job_url if '//' in job_url else '//' + job_url).hostname
+    except ValueError:  # Malformed URL (e.g. unbalanced IPv6 brackets)
+        return ''
+    return host or ''
+
+
+def _is_trusted_host(host: str, trusted_hosts: FrozenSet[str]) -> bool:
+    """True if host is a trusted domain or one of its subdomains (jobs.lever.co)."""
+    labels = host.split('.')
+    # One set lookup per parent domain: a.b.lever.co -> b.lever.co -> lever.co -> co
+    return any('.'.join(labels[i:]) in trusted_hosts for i in range(len(labels)))
 
 
 def check_trusted_domain(job_url: str, trusted_domains: List[str]) -> bool:
     """
     Check if job URL is from a trusted domain.
+    Matches on the URL's hostname, so a trusted domain that only shows up in
+    the path or query string (sketchy.com/?ref=linkedin.com) doesn't count.
     """
-    if not job_url or pd.isna(job_url):
+    if not job_url:
         return False
     
-    job_url_lower = job_url.lower()
-    return any(domain in job_url_lower for domain in trusted_domains)
+    return _is_trusted_host(_url_host(job_url), _trusted_hosts(tuple(trusted_domains)))
 
 
 def check_missing_company_info(company: str, description: str) -> bool:
     """
     Flag jobs with vague or missing company information.
     """
-    if not company or pd.isna(company):
+    if not company:
         return True
     
     company_lower = company.lower().strip()
     
-    # Suspicious company names
-    suspicious = [
-        'confidential',
-        'anonymous',
-        'undisclosed',
-        'private company',
-        'hiring now',
-        'urgent hiring',
-    ]
-    
-    return any(s in company_lower for s in suspicious)
+    return any(s in company_lower for s in SUSPICIOUS_COMPANY_NAMES)
 
 
 def check_deal_breakers(title: str, description: str, deal_breakers: List[str]) -> Tuple[bool, List[str]]:
@@ -126,28 +202,19 @@ def check_category_relevance(
     
     text = f"{title} {description or ''}".lower()
     
-    # Category-specific relevance keywords
-    category_keywords = {
-        'graphic_design': ['graphic', 'visual', 'design', 'creative', 'brand', 'adobe', 'photoshop', 'illustrator'],
-        'multimedia': ['video', 'motion', 'animation', 'after effects', 'premiere', 'multimedia', '3d'],
-        'administrative': ['admin', 'assistant', 'office', 'clerical', 'receptionist', 'scheduling', 'calendar'],
-        'cannabis': ['cannabis', 'dispensary', 'budtender', 'marijuana', 'thc', 'cbd'],
-    }
-    
-    keywords = category_keywords.get(category, [])
+    keywords = CATEGORY_KEYWORDS.get(category, ())
     if not keywords:
         return True, 0.5  # Unknown category, assume relevant
     
-    # Count keyword matches
-    matches = sum(1 for kw in keywords if kw in text)
+    # Count keyword matches. These are substring checks on purpose - "design"
+    # should match "designer" and "graphic" should match "graphics" - so they
+    # can't be replaced by a set intersection over word tokens
+    matches = sum(kw in text for kw in keywords)
     relevance_score = matches / len(keywords)
     
     # Check required skills
-    skill_matches = 0
     if required_skills:
-        for skill in required_skills:
-            if skill.lower() in text:
-                skill_matches += 1
+        skill_matches = sum(skill.lower() in text for skill in required_skills)
         skill_score = skill_matches / len(required_skills)
         relevance_score = (relevance_score + skill_score) / 2
     
@@ -156,6 +223,71 @@ def check_category_relevance(
     return is_relevant, relevance_score
 
 
+# Columns the filters read; normalized to plain strings once per batch
+TEXT_COLUMNS = ['title', 'description', 'company', 'job_url', 'category']
+
+
+def _text_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The filter input columns as strings, with missing columns and values as ''.
+    Works on a separate frame so the returned jobs keep their original values.
+    """
+    text = df.reindex(columns=TEXT_COLUMNS, fill_value='')
+    return text.fillna('').astype(str)
+
+
+def _contains_any(text: pd.Series, terms: List[str]) -> pd.Series:
+    """Boolean mask of rows whose text contains any of the literal terms."""
+    mask = pd.Series(False, index=text.index)
+    for term in terms:
+        mask |= text.str.contains(term, regex=False)
+    return mask
+
+
+@lru_cache(maxsize=32)
+def _overlap_pattern(terms: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Lookahead alternation that finds every term occurrence in one scan, or
+    None when one term is a prefix of another (both could start at the same
+    position but only the first alternative would be reported there).
+    """
+    if not terms or any(a != b and b.startswith(a) for a in terms for b in terms):
+        return None
+    return re.compile('(?=(' + '|'.join(re.escape(term) for term in terms) + '))')
+
+
+def _count_terms(text_lower: pd.Series, terms: Tuple[str, ...]) -> pd.Series:
+    """Number of distinct lowercase terms contained in each row of lowercased text."""
+    pattern = _overlap_pattern(terms)
+    if pattern is None:
+        return sum(text_lower.str.contains(term, regex=False) for term in terms)
+    return text_lower.str.findall(pattern).map(lambda hits: len(set(hits)))
+
+
+def _match_terms(text_lower: pd.Series, terms: List[str]) -> Tuple[pd.Series, pd.Series]:
+    """
+    Case-insensitive literal match of terms against already-lowercased text.
+    
+    Returns:
+        Tuple of (any-match mask, comma-joined matched terms per row)
+    """
+    lowered, pattern = _prepare_terms(tuple(terms))
+    matched = pd.Series('', index=text_lower.index)
+    if pattern is None:
+        return matched != '', matched
+    
+    # One combined search finds the rows with any hit; per-term checks only
+    # run on those rows to build the reason text
+    any_hit = text_lower.str.contains(pattern, regex=True)
+    hit_text = text_lower[any_hit]
+    hit_matched = pd.Series('', index=hit_text.index)
+    for term, term_lower in zip(terms, lowered):
+        hit = hit_text.str.contains(term_lower, regex=False)
+        hit_matched[hit] = hit_matched[hit] + ', ' + term
+    matched[any_hit] = hit_matched.str[2:].to_numpy()
+    return any_hit, matched
+
+
 def filter_jobs(jobs_df: pd.DataFrame) -> pd.DataFrame:
     """
     Main filtering function - applies all filters to job listings.
@@ -176,14 +308,6 @@ def filter_jobs(jobs_df: pd.DataFrame) -> pd.DataFrame:
     # Create copies to avoid SettingWithCopyWarning
     df = jobs_df.copy()
     
-    # Initialize filter result columns
-    df['is_scam'] = False
-    df['scam_reasons'] = ''
-    df['is_trusted_source'] = True
-    df['is_relevant'] = True
-    df['relevance_score'] = 0.5
-    df['filter_passed'] = True
-    
     scam_keywords = filter_config['scam_keywords']
     trusted_domains = filter_config['trusted_domains']
     
@@ -191,64 +315,89 @@ def filter_jobs(jobs_df: pd.DataFrame) -> pd.DataFrame:
     preferences = config.get('preferences', {})
     deal_breakers = preferences.get('deal_breakers', [])
     
-    for idx, row in df.iterrows():
-        reasons = []
-        title = str(row.get('title', ''))
-        description = str(row.get('description', ''))
-        
-        # Check deal-breakers FIRST (most important filter)
-        has_deal_breaker, matched_breakers = check_deal_breakers(title, description, deal_breakers)
-        if has_deal_breaker:
-            reasons.append(f"Deal-breaker: {', '.join(matched_breakers)}")
-        
-        # Check scam keywords in description
-        is_scam, matched_kw = check_scam_keywords(description, scam_keywords)
-        if is_scam:
-            reasons.append(f"Scam keywords: {', '.join(matched_kw)}")
-        
-        # Check unrealistic pay
-        if check_unrealistic_pay(description):
-            is_scam = True
-            reasons.append("Unrealistic pay claims")
-        
-        # Check company info
-        if check_missing_company_info(row.get('company', ''), description):
-            reasons.append("Missing/vague company info")
+    # Every check runs column-wise over the whole frame; the per-row check_*
+    # helpers above implement the same rules for single jobs
+    text = _text_frame(df)
+    title = text['title']
+    description = text['description']
+    text_lower = (title + ' ' + description).str.lower()
+    desc_lower = description.str.lower()
+    has_description = description != ''
+    
+    # Check deal-breakers FIRST (most important filter)
+    has_deal_breaker, breaker_reason = _match_terms(text_lower, deal_breakers)
+    
+    # Check scam keywords in description
+    is_scam, scam_reason = _match_terms(desc_lower, scam_keywords)
+    is_scam &= has_description
+    scam_reason = scam_reason.where(has_description, '')
+    
+    # Check unrealistic pay
+    unrealistic = description.str.contains(_UNREALISTIC_RE, regex=True)
+    is_scam |= unrealistic
+    
+    # Check company info
+    company = text['company']
+    vague_company = (company == '') | _contains_any(
+        company.str.lower().str.strip(), SUSPICIOUS_COMPANY_NAMES
+    )
+    
+    # Check trusted domain
+    # Job boards repeat a handful of hosts, so each distinct host is checked once
+    hosts = text['job_url'].map(_url_host)
+    trusted_hosts = _trusted_hosts(tuple(trusted_domains))
+    host_trusted = {host: _is_trusted_host(host, trusted_hosts) for host in hosts.unique()}
+    is_trusted = hosts.map(host_trusted).astype(bool)
+    
+    # Check category relevance
+    # A batch has only a few distinct categories: group rows by category
+    # (positions, so duplicate index labels are fine) and score each group
+    category = text['category'].astype('category')
+    category_rows = text_lower.groupby(category, sort=False, observed=True).indices
+    relevance_score = pd.Series(0.5, index=df.index)  # Unknown category, assume relevant
+    for cat, rows in category_rows.items():
+        keywords = CATEGORY_KEYWORDS.get(cat)
+        if not keywords:
+            continue
+        cat_text = text_lower.iloc[rows]
+        score = _count_terms(cat_text, keywords) / len(keywords)
         
-        # Check trusted domain
-        job_url = str(row.get('job_url', ''))
-        is_trusted = check_trusted_domain(job_url, trusted_domains)
-        
-        # Check category relevance
-        category = row.get('category', '')
-        category_config = search_config['categories'].get(category, {})
+        category_config = search_config['categories'].get(cat, {})
         required_skills = category_config.get('required_skills', [])
-        
-        is_relevant, relevance_score = check_category_relevance(
-            str(row.get('title', '')),
-            description,
-            category,
-            required_skills
-        )
-        
-        if not is_relevant:
-            reasons.append(f"Low relevance ({relevance_score:.0%})")
-        
-        # Update row
-        df.at[idx, 'is_scam'] = is_scam
-        df.at[idx, 'scam_reasons'] = '; '.join(reasons)
-        df.at[idx, 'is_trusted_source'] = is_trusted
-        df.at[idx, 'is_relevant'] = is_relevant
-        df.at[idx, 'relevance_score'] = relevance_score
-        
-        # Overall filter decision
-        df.at[idx, 'filter_passed'] = (
-            not is_scam and 
-            is_trusted and 
-            is_relevant and
-            not has_deal_breaker and
-            len(reasons) <= 1  # Allow 1 minor issue (like low relevance warning)
-        )
+        if required_skills:
+            skills = tuple(skill.lower() for skill in required_skills)
+            score = (score + _count_terms(cat_text, skills) / len(skills)) / 2
+        relevance_score.iloc[rows] = score.to_numpy()
+    relevance_score[title == ''] = 0.0
+    is_relevant = (relevance_score >= 0.1) & (title != '')  # At least 10% keyword match
+    
+    relevance_reason = relevance_score.map(lambda s: f"Low relevance ({s:.0%})").where(~is_relevant, '')
+    
+    reason_columns = [
+        ("Deal-breaker: " + breaker_reason).where(has_deal_breaker, ''),
+        ("Scam keywords: " + scam_reason).where(scam_reason != '', ''),
+        pd.Series('Unrealistic pay claims', index=df.index).where(unrealistic, ''),
+        pd.Series('Missing/vague company info', index=df.index).where(vague_company, ''),
+        relevance_reason,
+    ]
+    reason_count = sum((r != '').astype(int) for r in reason_columns)
+    
+    df['is_scam'] = is_scam
+    df['scam_reasons'] = [
+        '; '.join(r for r in reasons if r) for reasons in zip(*reason_columns)
+    ]
+    df['is_trusted_source'] = is_trusted
+    df['is_relevant'] = is_relevant
+    df['relevance_score'] = relevance_score
+    
+    # Overall filter decision
+    df['filter_passed'] = (
+        ~is_scam &
+        is_trusted &
+        is_relevant &
+        ~has_deal_breaker &
+        (reason_count <= 1)  # Allow 1 minor issue (like low relevance warning)
+    )
     
     # Count deal-breakers
     deal_breaker_count = sum(1 for r in df['scam_reasons'] if 'Deal-breaker' in str(r))
@@ -9,10 +9,11 @@ Comprehensive scan for:
 - Broken references
 """
 import os
-import re
 import sys
 import ast
+import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -31,28 +32,93 @@ print("-" * 50)
 
 skills_dir = os.path.dirname(__file__)
 
-# Read slack_notify.py
-with open(os.path.join(skills_dir, 'slack_notify.py'), 'r', encoding='utf-8') as f:
-    notify_content = f.read()
+required_files = [
+    'slack_notify.py',
+    'slack_action_listener.py',
+    'job_approval_workflow.py',
+    'document_generator.py',
+    'tailor_resume.py',
+    'write_cover_letter.py',
+    'real_auto_apply.py',
+    'playwright_automation.py',
+    'captcha_handler.py',
+    'job_search.py',
+    'gmail_handler.py',
+]
+
+
+# One directory listing gives existence and size for every skills file
+# (SCAN 3) without a stat call per required file
+with os.scandir(skills_dir) as entries:
+    file_sizes = {entry.name: entry.stat().st_size for entry in entries
+                  if entry.name.endswith('.py') and entry.is_file()}
+
+
+# Parse skills files: each file is read and parsed exactly once; SCAN 1
+# walks these trees and SCAN 6 reports their syntax errors
+def _syntax_check(filename):
+    """Parse one skills file; returns (filename, tree, error) - tree is None if missing or invalid."""
+    if filename not in file_sizes:
+        return filename, None, None
+    filepath = os.path.join(skills_dir, filename)
+    try:
+        with open(filepath, 'rb') as f:
+            return filename, ast.parse(f.read(), filename=filename), None
+    except SyntaxError as e:
+        return filename, None, e
+
+
+# Reads overlap across threads; map() keeps the report in file order
+with ThreadPoolExecutor(max_workers=8) as executor:
+    syntax_results = list(executor.map(_syntax_check, required_files))
+parsed_trees = {filename: tree for filename, tree, _ in syntax_results if tree is not None}
+
 
-# Read slack_action_listener.py
-with open(os.path.join(skills_dir, 'slack_action_listener.py'), 'r', encoding='utf-8') as f:
-    listener_content = f.read()
+def _str_constant(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
 
-# Read captcha_handler.py
-with open(os.path.join(skills_dir, 'captcha_handler.py'), 'r', encoding='utf-8') as f:
-    captcha_content = f.read()
 
-# Extract all action_ids from all files
+def _collect_action_ids(tree):
+    """
+    Single walk over a module collecting:
+    - button action_ids: literal "action_id": "..." entries in dict literals
+    - handler action_ids: functions decorated with @app.action("...")
+    """
+    buttons, handlers = set(), set()
+    if tree is None:
+        return buttons, handlers
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Dict):
+            for key, value in zip(node.keys, node.values):
+                if key is not None and _str_constant(key) == "action_id":
+                    action_id = _str_constant(value)
+                    if action_id is not None:
+                        buttons.add(action_id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in node.decorator_list:
+                if (isinstance(decorator, ast.Call) and decorator.args
+                        and isinstance(decorator.func, ast.Attribute)
+                        and decorator.func.attr == 'action'
+                        and isinstance(decorator.func.value, ast.Name)
+                        and decorator.func.value.id == 'app'):
+                    action_id = _str_constant(decorator.args[0])
+                    if action_id is not None:
+                        handlers.add(action_id)
+    return buttons, handlers
+
+
+# Extract all action_ids from the button-building files
 all_action_ids = set()
-all_action_ids.update(re.findall(r'"action_id":\s*"([^"]+)"', notify_content))
-all_action_ids.update(re.findall(r'"action_id":\s*"([^"]+)"', captcha_content))
+for filename in ('slack_notify.py', 'captcha_handler.py'):
+    all_action_ids.update(_collect_action_ids(parsed_trees.get(filename))[0])
 
 # Remove view_job_* (URL buttons, no handler needed)
 button_actions = {a for a in all_action_ids if not a.startswith('view_job_')}
 
 # Extract handler action_ids
-handler_actions = set(re.findall(r'@app\.action\("([^"]+)"\)', listener_content))
+handler_actions = _collect_action_ids(parsed_trees.get('slack_action_listener.py'))[1]
 
 missing_handlers = button_actions - handler_actions
 extra_handlers = handler_actions - button_actions
@@ -113,24 +179,9 @@ for module_name, functions in key_imports:
 print("\n📋 SCAN 3: Required Files")
 print("-" * 50)
 
-required_files = [
-    'slack_notify.py',
-    'slack_action_listener.py',
-    'job_approval_workflow.py',
-    'document_generator.py',
-    'tailor_resume.py',
-    'write_cover_letter.py',
-    'real_auto_apply.py',
-    'playwright_automation.py',
-    'captcha_handler.py',
-    'job_search.py',
-    'gmail_handler.py',
-]
-
 for filename in required_files:
-    filepath = os.path.join(skills_dir, filename)
-    if os.path.exists(filepath):
-        size = os.path.getsize(filepath)
+    size = file_sizes.get(filename)
+    if size is not None:
         print(f"  ✅ {filename} ({size:,} bytes)")
     else:
         issues.append(f"Missing file: {filename}")
@@ -164,23 +215,24 @@ for dir_path in data_dirs:
 print("\n📋 SCAN 5: Environment Variables")
 print("-" * 50)
 
-def load_env(var_name):
-    value = os.environ.get(var_name)
-    if value and len(value) > 10:
-        return value
+def load_env(var_names):
+    """Load env vars from Windows User scope with a single PowerShell spawn"""
+    missing = [v for v in var_names if not (os.environ.get(v) and len(os.environ[v]) > 10)]
+    if not missing:
+        return
+    lookups = '; '.join(f'{v}=[Environment]::GetEnvironmentVariable("{v}", "User")' for v in missing)
     try:
         result = subprocess.run(
-            ['powershell', '-NoProfile', '-Command', 
-             f'[Environment]::GetEnvironmentVariable("{var_name}", "User")'],
+            ['powershell', '-NoProfile', '-NonInteractive', '-Command', 
+             f'@{{{lookups}}} | ConvertTo-Json -Compress'],
             capture_output=True, text=True
         )
-        value = result.stdout.strip()
-        if value and len(value) > 10:
-            os.environ[var_name] = value
-            return value
+        values = json.loads(result.stdout or '{}')
+        for var_name, value in values.items():
+            if value and len(value) > 10:
+                os.environ[var_name] = value
     except:
         pass
-    return None
 
 env_vars = {
     'SLACK_BOT_TOKEN': 'Required for Slack',
@@ -191,9 +243,11 @@ env_vars = {
     'CaptchaKey': 'CAPTCHA solving',
 }
 
+load_env(env_vars)
+
 for var, purpose in env_vars.items():
-    value = load_env(var)
-    if value:
+    value = os.environ.get(var)
+    if value and len(value) > 10:
         print(f"  ✅ {var}: Set ({purpose})")
     else:
         if var in ['SLACK_BOT_TOKEN', 'SLACK_APP_TOKEN']:
@@ -209,17 +263,13 @@ for var, purpose in env_vars.items():
 print("\n📋 SCAN 6: Python Syntax Check")
 print("-" * 50)
 
-for filename in required_files:
-    filepath = os.path.join(skills_dir, filename)
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                source = f.read()
-            ast.parse(source)
-            print(f"  ✅ {filename}: Valid syntax")
-        except SyntaxError as e:
-            issues.append(f"{filename}: Syntax error at line {e.lineno}")
-            print(f"  ❌ {filename}: Syntax error at line {e.lineno}")
+# Files were parsed once up front (see "Parse skills files"); report results
+for filename, tree, error in syntax_results:
+    if error is not None:
+        issues.append(f"{filename}: Syntax error at line {error.lineno}")
+        print(f"  ❌ {filename}: Syntax error at line {error.lineno}")
+    elif tree is not None:
+        print(f"  ✅ {filename}: Valid syntax")
 
 # =============================================================================
 # SUMMARY
@@ -1,62 +1,87 @@
-import asyncio
-from playwright.async_api import async_playwright
-
-async def find_jobs():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        # Check multiple companies
-        companies = [
-            'https://jobs.lever.co/spotify',
-            'https://jobs.lever.co/databricks',
-            'https://jobs.lever.co/reddit',
-        ]
-        
-        design_jobs = []
-        
-        for company_url in companies:
-            company_name = company_url.split('/')[-1]
-            print(f"\nChecking {company_name}...")
-            
-            try:
-                await page.goto(company_url, wait_until='networkidle', timeout=30000)
-                await page.wait_for_timeout(2000)
-                
-                postings = await page.query_selector_all('.posting')
-                print(f"  Found {len(postings)} total jobs")
-                
-                for posting in postings:
-                    title = await posting.query_selector('h5')
-                    link = await posting.query_selector('a.posting-title')
-                    location = await posting.query_selector('.location')
-                    
-                    if title and link:
-                        title_text = await title.inner_text()
-                        href = await link.get_attribute('href')
-                        loc_text = await location.inner_text() if location else 'Unknown'
-                        
-                        keywords = ['design', 'creative', 'brand', 'visual', 'graphic', 'ux', 'ui', 'art director']
-                        if any(x in title_text.lower() for x in keywords):
-                            print(f"  >> {title_text} | {loc_text}")
-                            print(f"     {href}")
-                            design_jobs.append({
-                                'title': title_text,
-                                'company': company_name,
-                                'location': loc_text,
-                                'url': href
-                            })
-            except Exception as e:
-                print(f"  Error: {e}")
-        
-        await browser.close()
-        
-        print(f"\n\n=== FOUND {len(design_jobs)} DESIGN JOBS ===")
-        for job in design_jobs[:5]:
-            print(f"{job['title']} at {job['company']}")
-            print(f"  {job['url']}")
-        
-        return design_jobs
+import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Lever's public postings API returns every posting of a board as JSON in
+# one request - no browser or HTML parsing needed
+LEVER_API = 'https://api.lever.co/v0/postings/{company}?mode=json'
+
+# Substring match, like the old `x in title.lower()` checks: 'design'
+# also catches 'Designer', 'ui' catches 'UI/UX'
+DESIGN_KEYWORDS_RE = re.compile(
+    r'design|creative|brand|visual|graphic|ux|ui|art director', re.IGNORECASE
+)
+
+# Pool sized above the worker count so concurrent fetches never wait for a
+# connection; transient errors are retried instead of losing the board
+session = requests.Session()
+session.mount('https://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=('GET',), raise_on_status=False),
+))
+
+
+def scrape(company_url):
+    """Fetch one company's postings from the Lever API; returns (log lines, jobs)"""
+    company_name = company_url.split('/')[-1]
+    lines = [f"\nChecking {company_name}..."]
+    jobs = []
+
+    try:
+        r = session.get(LEVER_API.format(company=company_name), timeout=15)
+        r.raise_for_status()
+        postings = r.json()
+        lines.append(f"  Found {len(postings)} total jobs")
+
+        for posting in postings:
+            title_text = posting.get('text')
+            href = posting.get('hostedUrl')
+
+            if title_text and href:
+                loc_text = (posting.get('categories') or {}).get('location') or 'Unknown'
+
+                if DESIGN_KEYWORDS_RE.search(title_text):
+                    lines.append(f"  >> {title_text} | {loc_text}")
+                    lines.append(f"     {href}")
+                    jobs.append({
+                        'title': title_text,
+                        'company': company_name,
+                        'location': loc_text,
+                        'url': href
+                    })
+    except Exception as e:
+        lines.append(f"  Error: {e}")
+
+    return lines, jobs
+
+
+def find_jobs():
+    # Check multiple companies
+    companies = [
+        'https://jobs.lever.co/spotify',
+        'https://jobs.lever.co/databricks',
+        'https://jobs.lever.co/reddit',
+    ]
+
+    # All boards are fetched at once; output is printed afterwards in
+    # company order
+    with ThreadPoolExecutor(max_workers=len(companies)) as executor:
+        results = list(executor.map(scrape, companies))
+
+    design_jobs = []
+    for lines, jobs in results:
+        print('\n'.join(lines))
+        design_jobs.extend(jobs)
+
+    print(f"\n\n=== FOUND {len(design_jobs)} DESIGN JOBS ===")
+    for job in design_jobs[:5]:
+        print(f"{job['title']} at {job['company']}")
+        print(f"  {job['url']}")
+
+    return design_jobs
 
 if __name__ == "__main__":
-    asyncio.run(find_jobs())
+    find_jobs()
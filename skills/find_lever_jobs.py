@@ -1,5 +1,19 @@
+import os
+import re
+import time
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: selectolax (C HTML parser) is much faster than BeautifulSoup
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    from bs4 import BeautifulSoup
+    SELECTOLAX_AVAILABLE = False
 
 boards = [
     'https://jobs.lever.co/gusto',
@@ -8,23 +22,98 @@ boards = [
     'https://jobs.lever.co/mixpanel',
 ]
 
-for url in boards:
+# Substring match, like the old `x in title.lower()` checks: 'design'
+# also catches 'Designer', 'ui' catches 'UI/UX'
+DESIGN_KEYWORDS_RE = re.compile(
+    r'design|creative|brand|visual|graphic|ux|ui|product design', re.IGNORECASE
+)
+
+# All boards live on jobs.lever.co: one keep-alive session lets the
+# concurrent fetches share pooled TLS connections instead of a handshake each.
+# The pool is sized above the worker count so fetches never wait for a
+# connection, and transient errors are retried instead of losing the board
+session = requests.Session()
+session.mount('https://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=('GET',), raise_on_status=False),
+))
+
+
+parser = argparse.ArgumentParser(description="List design roles on Lever job boards")
+parser.add_argument('--refresh', action='store_true', help="Ignore cached board pages and re-download")
+args = parser.parse_args()
+
+# Boards change a few times a day at most: re-runs within the TTL read the
+# page saved by the last download instead of hitting the network
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '.lever_cache')
+CACHE_TTL = 6 * 3600
+
+
+def fetch(url):
+    """Download one board (or read it from the cache); returns (url, html bytes, error)"""
+    cache_path = os.path.join(CACHE_DIR, f"{url.rstrip('/').split('/')[-1]}.html")
+    if not args.refresh:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < CACHE_TTL:
+                with open(cache_path, 'rb') as f:
+                    return url, f.read(), None
+        except OSError:
+            pass
     try:
-        r = requests.get(url, timeout=15)
-        soup = BeautifulSoup(r.text, 'html.parser')
-        postings = soup.find_all('div', class_='posting')
-        company = url.split('/')[-1]
-        print(f"\n{company.upper()}: {len(postings)} jobs")
-        
+        r = session.get(url, timeout=15)
+    except Exception as e:
+        return url, None, e
+    # Only cache real board pages, not error responses
+    if r.ok:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(r.content)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    # Raw bytes: both parsers detect the page encoding themselves, so the
+    # page is never decoded into a separate str copy
+    return url, r.content, None
+
+
+def parse_postings(html):
+    """Returns (posting count, [(title, href)]) for the postings that have both"""
+    found = []
+    if SELECTOLAX_AVAILABLE:
+        postings = HTMLParser(html).css('div.posting')
+        for posting in postings:
+            title_elem = posting.css_first('h5')
+            link = posting.css_first('a.posting-title')
+            if title_elem and link:
+                found.append((title_elem.text().strip(), link.attributes.get('href') or ''))
+    else:
+        postings = BeautifulSoup(html, 'html.parser').find_all('div', class_='posting')
         for posting in postings:
             title_elem = posting.find('h5')
             link = posting.find('a', class_='posting-title')
             if title_elem and link:
-                title = title_elem.text.strip()
-                href = link.get('href', '')
-                keywords = ['design', 'creative', 'brand', 'visual', 'graphic', 'ux', 'ui', 'product design']
-                if any(x in title.lower() for x in keywords):
-                    print(f"  >> {title}")
-                    print(f"     {href}")
+                found.append((title_elem.text.strip(), link.get('href', '')))
+    return len(postings), found
+
+
+# Boards download concurrently; results are parsed and printed in board order
+with ThreadPoolExecutor(max_workers=len(boards)) as executor:
+    results = list(executor.map(fetch, boards))
+
+for url, html, error in results:
+    try:
+        if error is not None:
+            raise error
+        posting_count, postings = parse_postings(html)
+        company = url.split('/')[-1]
+        print(f"\n{company.upper()}: {posting_count} jobs")
+
+        for title, href in postings:
+            if DESIGN_KEYWORDS_RE.search(title):
+                print(f"  >> {title}")
+                print(f"     {href}")
     except Exception as e:
         print(f"{url}: Error - {e}")
@@ -8,13 +8,29 @@ LinkedIn Easy Apply, and company career pages.
 """
 
 import re
+import sys
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
+from functools import lru_cache
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a plain
+# (still frozen) dataclass
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class UserProfile:
-    """Complete user profile for form filling."""
+    """
+    Complete user profile for form filling.
+    Immutable: use dataclasses.replace(profile, ...) for per-job variations
+    (e.g. include_cannabis_exp=True for cannabis jobs).
+    """
     # Basic Info
     first_name: str = "Deanna"
     last_name: str = "Wiley"
@@ -108,6 +124,10 @@ class UserProfile:
     referred_by: str = ""
 
 
+# Shared default for callers that don't pass a profile (safe: UserProfile is frozen)
+_DEFAULT_PROFILE = UserProfile()
+
+
 # Field pattern matching - maps field identifiers to profile values
 FIELD_PATTERNS = {
     # ===== BASIC CONTACT INFO =====
@@ -392,6 +412,37 @@ FIELD_PATTERNS = {
     },
 }
 
+# Every FIELD_PATTERNS entry in one regex, one named group per field type.
+# Each alternative is a lookahead from the start of the string, so the regex
+# engine tries field types in dict order and returns the first whose patterns
+# match anywhere - the same priority as checking them one by one.
+_FIELD_RE = re.compile(
+    r'\A(?:' + '|'.join(
+        f"(?P<{field_type}>(?=(?s:.*?)(?:{'|'.join(config['patterns'])})))"
+        for field_type, config in FIELD_PATTERNS.items()
+    ) + ')',
+    re.IGNORECASE
+)
+# Profile attribute for each group of _FIELD_RE, indexed by match.lastindex
+_FIELD_VALUE_KEYS = (None,) + tuple(config['value_key'] for config in FIELD_PATTERNS.values())
+
+
+@lru_cache(maxsize=4096)
+def build_key(*parts: str) -> str:
+    """
+    Lowercased, space-joined field identifiers used for pattern matching.
+    Cached: a form runner asks about the same name/label several times.
+    """
+    return ' '.join(map(str, parts)).lower()
+
+
+def _field_value_for(combined: str, profile: UserProfile) -> Optional[str]:
+    """Profile value for the first FIELD_PATTERNS type matching the built key."""
+    match = _FIELD_RE.match(combined)
+    if match:
+        return getattr(profile, _FIELD_VALUE_KEYS[match.lastindex], None)
+    return None
+
 
 def get_field_value(field_name: str, field_label: str, profile: UserProfile = None) -> Optional[str]:
     """
@@ -406,60 +457,72 @@ def get_field_value(field_name: str, field_label: str, profile: UserProfile = No
         The value to fill, or None if no match found
     """
     if profile is None:
-        profile = UserProfile()
+        profile = _DEFAULT_PROFILE
     
-    combined = f"{field_name} {field_label}".lower()
-    
-    for field_type, config in FIELD_PATTERNS.items():
-        for pattern in config['patterns']:
-            if re.search(pattern, combined, re.IGNORECASE):
-                value_key = config['value_key']
-                return getattr(profile, value_key, None)
-    
-    return None
+    return _field_value_for(build_key(field_name, field_label), profile)
+
+
+# EEO questions answered with a "prefer not to say"-style option when offered
+_PREFER_NOT_FIELD_RE = re.compile(r'gender|race|ethnicity|veteran|disability')
+_DECLINE_OPTION_RE = re.compile(r'prefer|decline|not.?disclose', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class OptionIndex:
+    """A dropdown's option texts with their lowercased forms, built once per <select>."""
+    raw: tuple
+    lower: tuple
+    
+    @classmethod
+    def of(cls, options) -> 'OptionIndex':
+        if isinstance(options, cls):
+            return options
+        raw = tuple(options)
+        return cls(raw, tuple(opt.lower() for opt in raw))
 
 
-def get_select_value(field_name: str, field_label: str, options: list, profile: UserProfile = None) -> Optional[str]:
+def get_select_value(field_name: str, field_label: str, options, profile: UserProfile = None) -> Optional[str]:
     """
     Determine the best option to select for a dropdown/select field.
     
     Args:
         field_name: The field's name/id
         field_label: The field's label
-        options: List of available options
+        options: List of available options, or an OptionIndex built once
+            for a dropdown that is matched against several times
         profile: User profile
     
     Returns:
         The option value to select
     """
     if profile is None:
-        profile = UserProfile()
+        profile = _DEFAULT_PROFILE
     
-    combined = f"{field_name} {field_label}".lower()
+    index = OptionIndex.of(options)
+    options = index.raw
+    
+    combined = build_key(field_name, field_label)
     
     # Check for "Prefer not to say" questions (EEO)
-    prefer_not_patterns = ['gender', 'race', 'ethnicity', 'veteran', 'disability']
-    for pattern in prefer_not_patterns:
-        if pattern in combined:
-            # Look for prefer not to say option
-            for opt in options:
-                if 'prefer' in opt.lower() or 'decline' in opt.lower() or 'not.?disclose' in opt.lower():
-                    return opt
+    if _PREFER_NOT_FIELD_RE.search(combined):
+        # Look for prefer not to say option
+        for opt in options:
+            if _DECLINE_OPTION_RE.search(opt):
+                return opt
     
     # Get target value from profile
-    target_value = get_field_value(field_name, field_label, profile)
+    target_value = _field_value_for(combined, profile)
     if target_value:
         target_lower = target_value.lower()
         
         # Find best matching option
-        for opt in options:
-            if target_lower in opt.lower() or opt.lower() in target_lower:
+        for opt, opt_lower in zip(options, index.lower):
+            if target_lower in opt_lower or opt_lower in target_lower:
                 return opt
     
     # English level special handling
     if 'english' in combined or 'language' in combined or 'level' in combined:
-        for opt in options:
-            opt_lower = opt.lower()
+        for opt, opt_lower in zip(options, index.lower):
             if any(word in opt_lower for word in ['fluent', 'native', 'advanced', 'c2', 'c1']):
                 return opt
     
@@ -471,61 +534,77 @@ def get_select_value(field_name: str, field_label: str, options: list, profile:
     
     # Education level
     if 'education' in combined or 'degree' in combined:
-        for opt in options:
-            if 'bachelor' in opt.lower():
+        for opt, opt_lower in zip(options, index.lower):
+            if 'bachelor' in opt_lower:
                 return opt
     
     return None
 
 
-def get_radio_answer(field_name: str, field_label: str, question_text: str, profile: UserProfile = None) -> str:
-    """
-    Determine Yes/No answer for radio button questions.
-    
-    Returns: 'Yes', 'No', or None
-    """
-    if profile is None:
-        profile = UserProfile()
-    
-    combined = f"{field_name} {field_label} {question_text}".lower()
-    
+# Yes/No answers for radio questions, checked in order - the first rule with
+# a phrase in the question text decides the answer
+RADIO_RULES = (
     # Work authorization - Yes
-    if any(word in combined for word in ['authorized', 'eligible to work', 'legally work', 'right to work']):
-        return 'Yes'
-    
+    (('authorized', 'eligible to work', 'legally work', 'right to work'), 'Yes'),
     # Sponsorship - No
-    if any(word in combined for word in ['sponsor', 'visa', 'immigration support']):
-        return 'No'
-    
+    (('sponsor', 'visa', 'immigration support'), 'No'),
     # Location questions - based on actual location
-    if any(word in combined for word in ['latin america', 'latam', 'south america']):
-        return 'No'
-    if any(word in combined for word in ['europe', 'eu ', 'european union']):
-        return 'No'
-    if any(word in combined for word in ['united states', 'u.s.', 'usa', 'us-based']):
-        return 'Yes'
-    
+    (('latin america', 'latam', 'south america'), 'No'),
+    (('europe', 'eu ', 'european union'), 'No'),
+    (('united states', 'u.s.', 'usa', 'us-based'), 'Yes'),
     # Age verification - Yes
-    if any(word in combined for word in ['18 years', 'over 18', '18 or older', '21 years', 'over 21']):
-        return 'Yes'
-    
+    (('18 years', 'over 18', '18 or older', '21 years', 'over 21'), 'Yes'),
     # Relocation - No (based on config)
-    if 'relocat' in combined:
-        return 'No'
-    
+    (('relocat',), 'No'),
     # Background check consent - Yes
-    if 'background check' in combined or 'consent' in combined:
-        return 'Yes'
-    
+    (('background check', 'consent'), 'Yes'),
     # References available - Yes
-    if 'reference' in combined:
-        return 'Yes'
-    
-    # Currently employed
-    if 'currently employed' in combined:
-        return 'No'  # Looking for work
+    (('reference',), 'Yes'),
+    # Currently employed - No (looking for work)
+    (('currently employed',), 'No'),
+)
+
+
+def _build_radio_automaton():
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rule, (phrases, _) in enumerate(RADIO_RULES):
+        for phrase in phrases:
+            automaton.add_word(phrase, rule)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import; maps each phrase to the index of its rule
+_RADIO_AUTOMATON = _build_radio_automaton()
+
+
+def get_radio_answer(field_name: str, field_label: str, question_text: str, profile: UserProfile = None) -> str:
+    """
+    Determine Yes/No answer for radio button questions.
     
-    return None
+    Returns: 'Yes', 'No', or None
+    """
+    if profile is None:
+        profile = _DEFAULT_PROFILE
+    
+    combined = build_key(field_name, field_label, question_text)
+    
+    if _RADIO_AUTOMATON is None:
+        for phrases, answer in RADIO_RULES:
+            if any(phrase in combined for phrase in phrases):
+                return answer
+        return None
+    
+    # One pass finds every rule phrase in the text; the earliest rule wins
+    best = None
+    for _, rule in _RADIO_AUTOMATON.iter(combined):
+        if best is None or rule < best:
+            best = rule
+            if best == 0:
+                break
+    return RADIO_RULES[best][1] if best is not None else None
 
 
 # Common dropdown option mappings
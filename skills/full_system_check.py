@@ -10,27 +10,31 @@ import sys
 import os
 import subprocess
 import time
+import io
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.dirname(__file__))
 
-def load_env(var_name):
-    """Load env var from Windows User scope"""
-    value = os.environ.get(var_name)
-    if value and len(value) > 10:
-        return value
+def load_env(var_names):
+    """Load env vars from Windows User scope with a single PowerShell spawn"""
+    missing = [v for v in var_names if not (os.environ.get(v) and len(os.environ[v]) > 10)]
+    if not missing:
+        return
+    lookups = '; '.join(f'{v}=[Environment]::GetEnvironmentVariable("{v}", "User")' for v in missing)
     try:
         result = subprocess.run(
-            ['powershell', '-NoProfile', '-Command', 
-             f'[Environment]::GetEnvironmentVariable("{var_name}", "User")'],
+            ['powershell', '-NoProfile', '-NonInteractive', '-Command', 
+             f'@{{{lookups}}} | ConvertTo-Json -Compress'],
             capture_output=True, text=True
         )
-        value = result.stdout.strip()
-        if value and len(value) > 10:
-            os.environ[var_name] = value
-            return value
+        values = json.loads(result.stdout or '{}')
+        for var_name, value in values.items():
+            if value and len(value) > 10:
+                os.environ[var_name] = value
     except:
         pass
-    return None
 
 # Pre-load all required env vars
 ENV_VARS = [
@@ -39,8 +43,7 @@ ENV_VARS = [
     'CaptchaKey', 'CAPTCHA_2CAPTCHA_KEY',
     'GMAIL_CLIENT_ID', 'GMAIL_CLIENT_SECRET'
 ]
-for var in ENV_VARS:
-    load_env(var)
+load_env(ENV_VARS)
 
 print("=" * 70)
 print("🦞 CLAWDBOT FULL SYSTEM HEALTH CHECK")
@@ -48,189 +51,219 @@ print("=" * 70)
 
 results = {}
 
+def _header(title):
+    """Section title block for a check's log"""
+    return f"\n{title}\n{'-' * 50}"
+
 # 1. Environment Variables
-print("\n🔑 Environment Variables")
-print("-" * 50)
-env_status = {
-    'Slack Bot': 'SLACK_BOT_TOKEN',
-    'Slack App': 'SLACK_APP_TOKEN',
-    'OpenRouter': 'OPENROUTER_API_KEY',
-    'Groq': 'GROQ_API_KEY',
-    'Gemini': 'GEMINI_API_KEY',
-    'CAPTCHA': 'CaptchaKey',
-    'Gmail': 'GMAIL_CLIENT_ID'
-}
-for name, var in env_status.items():
-    val = os.environ.get(var)
-    status = "✅" if val and len(val) > 10 else "❌"
-    print(f"  {status} {name}")
+def check_env(log):
+    log(_header("🔑 Environment Variables"))
+    env_status = {
+        'Slack Bot': 'SLACK_BOT_TOKEN',
+        'Slack App': 'SLACK_APP_TOKEN',
+        'OpenRouter': 'OPENROUTER_API_KEY',
+        'Groq': 'GROQ_API_KEY',
+        'Gemini': 'GEMINI_API_KEY',
+        'CAPTCHA': 'CaptchaKey',
+        'Gmail': 'GMAIL_CLIENT_ID'
+    }
+    for name, var in env_status.items():
+        val = os.environ.get(var)
+        status = "✅" if val and len(val) > 10 else "❌"
+        log(f"  {status} {name}")
+    return {}
 
 # 2. Slack Connection
-print("\n💬 Slack Connection")
-print("-" * 50)
-try:
-    from slack_sdk import WebClient
-    token = os.environ.get('SLACK_BOT_TOKEN')
-    client = WebClient(token=token)
-    auth = client.auth_test()
-    print(f"  ✅ Connected as: {auth['user']}")
-    print(f"  ✅ Team: {auth['team']}")
-    results['slack'] = True
-except Exception as e:
-    print(f"  ❌ {e}")
-    results['slack'] = False
+def check_slack(log):
+    log(_header("💬 Slack Connection"))
+    try:
+        from slack_sdk import WebClient
+        token = os.environ.get('SLACK_BOT_TOKEN')
+        client = WebClient(token=token)
+        auth = client.auth_test()
+        log(f"  ✅ Connected as: {auth['user']}")
+        log(f"  ✅ Team: {auth['team']}")
+        return {'slack': True}
+    except Exception as e:
+        log(f"  ❌ {e}")
+        return {'slack': False}
 
 # 3. LLM Fallback Chain
-print("\n🤖 LLM Fallback Chain")
-print("-" * 50)
-import requests
-for name, key_var, url in [
-    ('OpenRouter', 'OPENROUTER_API_KEY', 'https://openrouter.ai/api/v1/chat/completions'),
-    ('Groq', 'GROQ_API_KEY', 'https://api.groq.com/openai/v1/chat/completions'),
-]:
-    key = os.environ.get(key_var)
-    if key:
-        try:
-            if 'openrouter' in url:
-                resp = requests.post(url, headers={"Authorization": f"Bearer {key}"},
-                    json={"model": "anthropic/claude-3.5-sonnet", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 5}, timeout=10)
-            else:
-                resp = requests.post(url, headers={"Authorization": f"Bearer {key}"},
-                    json={"model": "llama-3.3-70b-versatile", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 5}, timeout=10)
-            if resp.status_code == 200:
-                print(f"  ✅ {name}: Working")
-            elif resp.status_code == 402:
-                print(f"  ⚠️ {name}: No credits")
-            else:
-                print(f"  ⚠️ {name}: {resp.status_code}")
-        except Exception as e:
-            print(f"  ❌ {name}: {e}")
-    else:
-        print(f"  ⏭️ {name}: No key")
+def check_llm(log):
+    log(_header("🤖 LLM Fallback Chain"))
+    import requests
+    for name, key_var, url in [
+        ('OpenRouter', 'OPENROUTER_API_KEY', 'https://openrouter.ai/api/v1/chat/completions'),
+        ('Groq', 'GROQ_API_KEY', 'https://api.groq.com/openai/v1/chat/completions'),
+    ]:
+        key = os.environ.get(key_var)
+        if key:
+            try:
+                if 'openrouter' in url:
+                    resp = requests.post(url, headers={"Authorization": f"Bearer {key}"},
+                        json={"model": "anthropic/claude-3.5-sonnet", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 5}, timeout=10)
+                else:
+                    resp = requests.post(url, headers={"Authorization": f"Bearer {key}"},
+                        json={"model": "llama-3.3-70b-versatile", "messages": [{"role": "user", "content": "hi"}], "max_tokens": 5}, timeout=10)
+                if resp.status_code == 200:
+                    log(f"  ✅ {name}: Working")
+                elif resp.status_code == 402:
+                    log(f"  ⚠️ {name}: No credits")
+                else:
+                    log(f"  ⚠️ {name}: {resp.status_code}")
+            except Exception as e:
+                log(f"  ❌ {name}: {e}")
+        else:
+            log(f"  ⏭️ {name}: No key")
+    return {}
 
 # 4. Gmail Integration
-print("\n📧 Gmail Integration")
-print("-" * 50)
-try:
-    from gmail_handler import get_email_summary
-    summary = get_email_summary()
-    print(f"  ✅ Connected: {summary['total']} job emails (14 days)")
-    results['gmail'] = True
-except Exception as e:
-    print(f"  ❌ {e}")
-    results['gmail'] = False
+def check_gmail(log):
+    log(_header("📧 Gmail Integration"))
+    try:
+        from gmail_handler import get_email_summary
+        summary = get_email_summary()
+        log(f"  ✅ Connected: {summary['total']} job emails (14 days)")
+        return {'gmail': True}
+    except Exception as e:
+        log(f"  ❌ {e}")
+        return {'gmail': False}
 
 # 5. Document Generation
-print("\n📄 Document Generation")
-print("-" * 50)
-try:
-    from tailor_resume import tailor_resume
-    from write_cover_letter import generate_cover_letter
-    print("  ✅ Resume tailoring: Ready")
-    print("  ✅ Cover letter: Ready")
-    results['docs'] = True
-except Exception as e:
-    print(f"  ❌ {e}")
-    results['docs'] = False
+def check_docs(log):
+    log(_header("📄 Document Generation"))
+    try:
+        from tailor_resume import tailor_resume
+        from write_cover_letter import generate_cover_letter
+        log("  ✅ Resume tailoring: Ready")
+        log("  ✅ Cover letter: Ready")
+        return {'docs': True}
+    except Exception as e:
+        log(f"  ❌ {e}")
+        return {'docs': False}
 
 # 6. Job Search
-print("\n🔍 Job Search")
-print("-" * 50)
-try:
-    from job_search import search_jobs_for_category
-    print("  ✅ JobSpy integration: Ready")
-    results['job_search'] = True
-except Exception as e:
-    print(f"  ❌ {e}")
-    results['job_search'] = False
+def check_job_search(log):
+    log(_header("🔍 Job Search"))
+    try:
+        from job_search import search_jobs_for_category
+        log("  ✅ JobSpy integration: Ready")
+        return {'job_search': True}
+    except Exception as e:
+        log(f"  ❌ {e}")
+        return {'job_search': False}
 
 # 7. Playwright Automation
-print("\n🎭 Playwright Automation")
-print("-" * 50)
-try:
-    from playwright_automation import ApplicationEngine
-    from playwright.sync_api import sync_playwright
-    print("  ✅ ApplicationEngine: Ready")
-    print("  ✅ Playwright module: Installed")
-    results['playwright'] = True
-except Exception as e:
-    print(f"  ❌ {e}")
-    results['playwright'] = False
+def check_playwright(log):
+    log(_header("🎭 Playwright Automation"))
+    try:
+        from playwright_automation import ApplicationEngine
+        from playwright.sync_api import sync_playwright
+        log("  ✅ ApplicationEngine: Ready")
+        log("  ✅ Playwright module: Installed")
+        return {'playwright': True}
+    except Exception as e:
+        log(f"  ❌ {e}")
+        return {'playwright': False}
 
 # 8. CAPTCHA Handler
-print("\n🔐 CAPTCHA Handler")
-print("-" * 50)
-try:
-    from captcha_handler import CaptchaSolvingService, HumanAssistant
-    print("  ✅ 2Captcha integration: Ready")
-    print("  ✅ Human fallback: Ready")
-    results['captcha'] = True
-except Exception as e:
-    print(f"  ❌ {e}")
-    results['captcha'] = False
+def check_captcha(log):
+    log(_header("🔐 CAPTCHA Handler"))
+    try:
+        from captcha_handler import CaptchaSolvingService, HumanAssistant
+        log("  ✅ 2Captcha integration: Ready")
+        log("  ✅ Human fallback: Ready")
+        return {'captcha': True}
+    except Exception as e:
+        log(f"  ❌ {e}")
+        return {'captcha': False}
+
+# Checks 9 and 10 both read Windows state: one PowerShell spawn returns the
+# scheduled tasks and the listener process counts as JSON for both
+WINDOWS_STATUS_PS = (
+    '$t = @(Get-ScheduledTask | Where-Object {$_.TaskName -like "JobAssistant*"} | '
+    'Select-Object TaskName, @{n="State"; e={"$($_.State)"}}); '
+    '$p = (Get-Process python -ErrorAction SilentlyContinue | Measure-Object).Count; '
+    '$n = (Get-Process node -ErrorAction SilentlyContinue | Measure-Object).Count; '
+    '@{tasks=$t; python=$p; node=$n} | ConvertTo-Json -Compress'
+)
+_windows_status_lock = threading.Lock()
+_windows_status = None
+
+def get_windows_status():
+    """Run the shared PowerShell probe once; both checks get the same result (or error)"""
+    global _windows_status
+    with _windows_status_lock:
+        if _windows_status is None:
+            try:
+                result = subprocess.run(
+                    ['powershell', '-NoProfile', '-NonInteractive', '-Command', WINDOWS_STATUS_PS],
+                    capture_output=True, text=True
+                )
+                _windows_status = (json.loads(result.stdout or '{}'), None)
+            except Exception as e:
+                _windows_status = (None, e)
+    status, error = _windows_status
+    if error is not None:
+        raise error
+    return status
 
 # 9. Scheduled Tasks
-print("\n⏰ Scheduled Tasks")
-print("-" * 50)
-try:
-    result = subprocess.run(
-        ['powershell', '-NoProfile', '-Command', 
-         'Get-ScheduledTask | Where-Object {$_.TaskName -like "JobAssistant*"} | Select-Object TaskName, State'],
-        capture_output=True, text=True
-    )
-    if 'JobAssistant' in result.stdout:
-        for line in result.stdout.strip().split('\n'):
-            if 'JobAssistant' in line:
-                print(f"  ✅ {line.strip()}")
-        results['tasks'] = True
-    else:
-        print("  ⚠️ No scheduled tasks found")
-        results['tasks'] = False
-except Exception as e:
-    print(f"  ❌ {e}")
-    results['tasks'] = False
+def check_tasks(log):
+    log(_header("⏰ Scheduled Tasks"))
+    try:
+        tasks = get_windows_status().get('tasks') or []
+        if tasks:
+            for task in tasks:
+                log(f"  ✅ {task['TaskName']} {task['State']}")
+            return {'tasks': True}
+        else:
+            log("  ⚠️ No scheduled tasks found")
+            return {'tasks': False}
+    except Exception as e:
+        log(f"  ❌ {e}")
+        return {'tasks': False}
 
 # 10. Gateway Process
-print("\n🌐 Slack Listener Process")
-print("-" * 50)
-try:
-    # Check for Python Slack listener OR node gateway
-    py_result = subprocess.run(
-        ['powershell', '-NoProfile', '-Command', 
-         'Get-Process python -ErrorAction SilentlyContinue | Measure-Object'],
-        capture_output=True, text=True
-    )
-    node_result = subprocess.run(
-        ['powershell', '-NoProfile', '-Command', 
-         'Get-Process node -ErrorAction SilentlyContinue | Measure-Object'],
-        capture_output=True, text=True
-    )
-    
-    py_count = 0
-    node_count = 0
-    for line in py_result.stdout.split('\n'):
-        if 'Count' in line:
-            parts = line.split(':')
-            if len(parts) > 1:
-                py_count = int(parts[1].strip())
-    for line in node_result.stdout.split('\n'):
-        if 'Count' in line:
-            parts = line.split(':')
-            if len(parts) > 1:
-                node_count = int(parts[1].strip())
-    
-    if py_count > 0 or node_count > 0:
-        if py_count > 0:
-            print(f"  ✅ Python Slack listener running")
-        if node_count > 0:
-            print(f"  ✅ Node gateway running ({node_count} processes)")
-        results['gateway'] = True
-    else:
-        print(f"  ⚠️ No listener process running")
-        results['gateway'] = False
-except Exception as e:
-    print(f"  ❌ Error: {e}")
-    results['gateway'] = False
+def check_gateway(log):
+    log(_header("🌐 Slack Listener Process"))
+    try:
+        # Check for Python Slack listener OR node gateway
+        status = get_windows_status()
+        py_count = int(status.get('python') or 0)
+        node_count = int(status.get('node') or 0)
+        
+        if py_count > 0 or node_count > 0:
+            if py_count > 0:
+                log(f"  ✅ Python Slack listener running")
+            if node_count > 0:
+                log(f"  ✅ Node gateway running ({node_count} processes)")
+            return {'gateway': True}
+        else:
+            log(f"  ⚠️ No listener process running")
+            return {'gateway': False}
+    except Exception as e:
+        log(f"  ❌ Error: {e}")
+        return {'gateway': False}
+
+CHECKS = [
+    check_env, check_slack, check_llm, check_gmail, check_docs,
+    check_job_search, check_playwright, check_captcha, check_tasks, check_gateway,
+]
+
+def _run_check(check):
+    """Run one check, buffering its log so concurrent checks don't interleave"""
+    out = io.StringIO()
+    check_results = check(lambda msg: out.write(msg + "\n"))
+    return check_results, out.getvalue()
+
+# The checks are independent and mostly wait on Slack, Gmail, the LLM APIs or
+# PowerShell, so run them together and report in the original order
+with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+    for check_results, output in executor.map(_run_check, CHECKS):
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        results.update(check_results)
 
 # Summary
 print("\n" + "=" * 70)
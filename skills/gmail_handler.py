@@ -16,6 +16,7 @@ import re
 import json
 import pickle
 import base64
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from email.mime.text import MIMEText
@@ -73,6 +74,40 @@ JOB_EMAIL_PATTERNS = {
     ],
 }
 
+# Compiled once at import. A category's patterns are counted individually
+# (confidence = distinct patterns matched), so each category also gets one
+# combined alternation that rules out non-matching text in a single scan
+EMAIL_PATTERN_RES = {
+    email_type: [re.compile(p) for p in patterns]
+    for email_type, patterns in JOB_EMAIL_PATTERNS.items()
+}
+EMAIL_CATEGORY_RES = {
+    email_type: re.compile('|'.join(f'(?:{p})' for p in patterns))
+    for email_type, patterns in JOB_EMAIL_PATTERNS.items()
+}
+
+MONTHS = 'January|February|March|April|May|June|July|August|September|October|November|December'
+
+# Scheduling patterns stay separate: dates and times are collected pattern
+# by pattern, and the first meeting pattern that matches wins
+DATE_RES = [
+    re.compile(r'(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
+    re.compile(rf'({MONTHS})\s+\d{{1,2}}', re.IGNORECASE),
+    re.compile(rf'(Monday|Tuesday|Wednesday|Thursday|Friday)\s*,?\s*({MONTHS})?\s*\d{{1,2}}', re.IGNORECASE),
+]
+
+TIME_RES = [
+    re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)'),
+    re.compile(r'(\d{1,2}\s*(?:AM|PM|am|pm))'),
+]
+
+MEETING_LINK_RES = [
+    re.compile(r'(https?://[^\s]*zoom[^\s]*)', re.IGNORECASE),
+    re.compile(r'(https?://[^\s]*meet\.google[^\s]*)', re.IGNORECASE),
+    re.compile(r'(https?://[^\s]*teams\.microsoft[^\s]*)', re.IGNORECASE),
+    re.compile(r'(https?://calendly\.com/[^\s]*)', re.IGNORECASE),
+]
+
 
 def get_credentials() -> Optional[Credentials]:
     """
@@ -137,6 +172,63 @@ def get_gmail_service():
     return build('gmail', 'v1', credentials=creds)
 
 
+# Gmail accepts 100 sub-requests per batch call, but recommends at most 50:
+# larger batches trip the per-user rate limit
+GMAIL_BATCH_LIMIT = 50
+GMAIL_BATCH_RETRIES = 3
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _is_retryable(exception: Exception) -> bool:
+    """Rate-limit and server errors are worth retrying; 404s and auth errors aren't."""
+    status = getattr(getattr(exception, 'resp', None), 'status', None)
+    if status in RETRY_STATUS_CODES:
+        return True
+    return status == 403 and 'ratelimitexceeded' in str(exception).lower()
+
+
+def batch_get_messages(service, message_ids: List[str], **get_kwargs) -> List[Dict]:
+    """
+    Fetch messages with batched messages().get() calls (one HTTP round trip
+    per 50 messages). Sub-requests that hit rate limits or server errors are
+    retried with backoff; messages that still can't be fetched are skipped.
+    Results keep message_ids order.
+    """
+    responses = {}
+    errors = {}
+    failed = {}
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            errors[request_id] = exception
+        else:
+            responses[request_id] = response
+
+    pending = list(message_ids)
+    for attempt in range(GMAIL_BATCH_RETRIES + 1):
+        errors.clear()
+        for start in range(0, len(pending), GMAIL_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=on_response)
+            for message_id in pending[start:start + GMAIL_BATCH_LIMIT]:
+                batch.add(
+                    service.users().messages().get(userId='me', id=message_id, **get_kwargs),
+                    request_id=message_id
+                )
+            batch.execute()
+        
+        pending = [message_id for message_id, e in errors.items() if _is_retryable(e)]
+        failed.update((message_id, e) for message_id, e in errors.items() if message_id not in pending)
+        if not pending or attempt == GMAIL_BATCH_RETRIES:
+            failed.update((message_id, errors[message_id]) for message_id in pending)
+            break
+        time.sleep(2 ** attempt)
+    
+    if failed:
+        print(f"Skipped {len(failed)} message(s) that could not be fetched: {next(iter(failed.values()))}")
+    
+    return [responses[message_id] for message_id in message_ids if message_id in responses]
+
+
 def classify_email(subject: str, body: str) -> Dict:
     """
     Classify an email based on job-related patterns.
@@ -150,8 +242,10 @@ def classify_email(subject: str, body: str) -> Dict:
         'action_type': None,
     }
     
-    for email_type, patterns in JOB_EMAIL_PATTERNS.items():
-        matches = sum(1 for p in patterns if re.search(p, text))
+    for email_type, patterns in EMAIL_PATTERN_RES.items():
+        if not EMAIL_CATEGORY_RES[email_type].search(text):
+            continue
+        matches = sum(1 for p in patterns if p.search(text))
         confidence = matches / len(patterns)
         
         if confidence > classifications['confidence']:
@@ -182,36 +276,18 @@ def extract_scheduling_info(body: str) -> Dict:
     }
     
     # Extract dates (various formats)
-    date_patterns = [
-        r'(\d{1,2}/\d{1,2}/\d{2,4})',
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}',
-        r'(Monday|Tuesday|Wednesday|Thursday|Friday)\s*,?\s*(January|February|March|April|May|June|July|August|September|October|November|December)?\s*\d{1,2}',
-    ]
-    
-    for pattern in date_patterns:
-        matches = re.findall(pattern, body, re.IGNORECASE)
+    for pattern in DATE_RES:
+        matches = pattern.findall(body)
         info['dates_mentioned'].extend([m if isinstance(m, str) else ' '.join(m) for m in matches])
     
     # Extract times
-    time_patterns = [
-        r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)',
-        r'(\d{1,2}\s*(?:AM|PM|am|pm))',
-    ]
-    
-    for pattern in time_patterns:
-        matches = re.findall(pattern, body)
+    for pattern in TIME_RES:
+        matches = pattern.findall(body)
         info['times_mentioned'].extend(matches)
     
     # Extract meeting links
-    meeting_patterns = [
-        r'(https?://[^\s]*zoom[^\s]*)',
-        r'(https?://[^\s]*meet\.google[^\s]*)',
-        r'(https?://[^\s]*teams\.microsoft[^\s]*)',
-        r'(https?://calendly\.com/[^\s]*)',
-    ]
-    
-    for pattern in meeting_patterns:
-        match = re.search(pattern, body, re.IGNORECASE)
+    for pattern in MEETING_LINK_RES:
+        match = pattern.search(body)
         if match:
             info['meeting_link'] = match.group(1)
             break
@@ -219,9 +295,62 @@ def extract_scheduling_info(body: str) -> Dict:
     return info
 
 
+# Types that are settled from the subject and snippet alone; every other
+# message gets its full body fetched and is classified again
+BODY_SKIP_TYPES = {'rejection', 'application_received'}
+
+
+def _list_message_ids(service, query: str, max_results: int) -> List[str]:
+    """IDs of the messages matching a Gmail query."""
+    results = service.users().messages().list(
+        userId='me',
+        q=query,
+        maxResults=max_results
+    ).execute()
+    return [msg['id'] for msg in results.get('messages', [])]
+
+
+def _fetch_metadata_batch(service, message_ids: List[str]) -> List[Dict]:
+    """Headers, snippet and labels only - no MIME parts or bodies."""
+    return batch_get_messages(
+        service, message_ids,
+        format='metadata', metadataHeaders=['From', 'Subject', 'Date']
+    )
+
+
+def _message_body(msg_data: Dict) -> str:
+    """Decode the text/plain body of a format='full' message."""
+    body = ''
+    if 'parts' in msg_data['payload']:
+        for part in msg_data['payload']['parts']:
+            if part['mimeType'] == 'text/plain':
+                body = base64.urlsafe_b64decode(part['body'].get('data', '')).decode('utf-8', errors='ignore')
+                break
+    elif 'body' in msg_data['payload']:
+        body = base64.urlsafe_b64decode(msg_data['payload']['body'].get('data', '')).decode('utf-8', errors='ignore')
+    return body
+
+
+def _fetch_full_body_if_actionable(service, emails: List[Dict]) -> Dict[str, str]:
+    """
+    Fetch full bodies only for emails whose subject/snippet classification
+    could still need them; rejections and confirmations are skipped.
+    Returns {message id: body}.
+    """
+    ids = [e['id'] for e in emails if e['classification']['type'] not in BODY_SKIP_TYPES]
+    return {
+        msg_data['id']: _message_body(msg_data)
+        for msg_data in batch_get_messages(service, ids, format='full')
+    }
+
+
 def get_job_emails(days_back: int = 7, max_results: int = 50) -> List[Dict]:
     """
     Fetch and classify job-related emails from the past N days.
+    
+    Messages are first fetched as metadata and classified from subject and
+    snippet. Full bodies are only downloaded for messages that are not
+    already a rejection or confirmation; for those, 'body' is empty.
     """
     service = get_gmail_service()
     if not service:
@@ -234,51 +363,35 @@ def get_job_emails(days_back: int = 7, max_results: int = 50) -> List[Dict]:
     query = f'after:{after_date} (subject:interview OR subject:application OR subject:position OR subject:opportunity OR subject:hiring OR from:recruiter OR from:talent OR from:hr)'
     
     try:
-        results = service.users().messages().list(
-            userId='me',
-            q=query,
-            maxResults=max_results
-        ).execute()
-        
-        messages = results.get('messages', [])
+        message_ids = _list_message_ids(service, query, max_results)
         emails = []
         
-        for msg in messages:
-            msg_data = service.users().messages().get(
-                userId='me',
-                id=msg['id'],
-                format='full'
-            ).execute()
-            
-            # Extract headers
+        for msg_data in _fetch_metadata_batch(service, message_ids):
             headers = {h['name']: h['value'] for h in msg_data['payload']['headers']}
-            
-            # Extract body
-            body = ''
-            if 'parts' in msg_data['payload']:
-                for part in msg_data['payload']['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        body = base64.urlsafe_b64decode(part['body'].get('data', '')).decode('utf-8', errors='ignore')
-                        break
-            elif 'body' in msg_data['payload']:
-                body = base64.urlsafe_b64decode(msg_data['payload']['body'].get('data', '')).decode('utf-8', errors='ignore')
-            
-            # Classify email
-            classification = classify_email(headers.get('Subject', ''), body)
-            scheduling_info = extract_scheduling_info(body)
+            snippet = msg_data.get('snippet', '')
             
             emails.append({
-                'id': msg['id'],
+                'id': msg_data['id'],
                 'thread_id': msg_data['threadId'],
                 'subject': headers.get('Subject', ''),
                 'from': headers.get('From', ''),
                 'date': headers.get('Date', ''),
-                'snippet': msg_data.get('snippet', ''),
-                'body': body[:1000],  # First 1000 chars
-                'classification': classification,
-                'scheduling_info': scheduling_info,
+                'snippet': snippet,
+                'body': '',
+                'classification': classify_email(headers.get('Subject', ''), snippet),
+                'scheduling_info': extract_scheduling_info(''),
             })
         
+        bodies = _fetch_full_body_if_actionable(service, emails)
+        
+        for email in emails:
+            body = bodies.get(email['id'])
+            if body is None:
+                continue
+            email['body'] = body[:1000]  # First 1000 chars
+            email['classification'] = classify_email(email['subject'], body)
+            email['scheduling_info'] = extract_scheduling_info(body)
+        
         return emails
         
     except Exception as e:
@@ -566,27 +679,14 @@ def search_emails(query: str, max_results: int = 20) -> List[Dict]:
         return []
     
     try:
-        results = service.users().messages().list(
-            userId='me',
-            q=query,
-            maxResults=max_results
-        ).execute()
-        
-        messages = results.get('messages', [])
+        message_ids = _list_message_ids(service, query, max_results)
         emails = []
         
-        for msg in messages:
-            msg_data = service.users().messages().get(
-                userId='me',
-                id=msg['id'],
-                format='metadata',
-                metadataHeaders=['From', 'Subject', 'Date']
-            ).execute()
-            
+        for msg_data in _fetch_metadata_batch(service, message_ids):
             headers = {h['name']: h['value'] for h in msg_data['payload']['headers']}
             
             emails.append({
-                'id': msg['id'],
+                'id': msg_data['id'],
                 'thread_id': msg_data['threadId'],
                 'subject': headers.get('Subject', ''),
                 'from': headers.get('From', ''),
@@ -619,15 +719,7 @@ def get_email_by_id(message_id: str) -> Optional[Dict]:
         
         headers = {h['name']: h['value'] for h in msg_data['payload']['headers']}
         
-        # Extract body
-        body = ''
-        if 'parts' in msg_data['payload']:
-            for part in msg_data['payload']['parts']:
-                if part['mimeType'] == 'text/plain':
-                    body = base64.urlsafe_b64decode(part['body'].get('data', '')).decode('utf-8', errors='ignore')
-                    break
-        elif 'body' in msg_data['payload']:
-            body = base64.urlsafe_b64decode(msg_data['payload']['body'].get('data', '')).decode('utf-8', errors='ignore')
+        body = _message_body(msg_data)
         
         return {
             'id': message_id,
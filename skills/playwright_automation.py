@@ -767,7 +767,7 @@ class ApplicationEngine:
     async def _fill_remaining_fields(self):
         """Fill any remaining unfilled fields using comprehensive field config."""
         try:
-            from form_field_config import get_field_value, get_select_value, get_radio_answer, UserProfile
+            from form_field_config import get_field_value, get_select_value, get_radio_answer, UserProfile, OptionIndex
             profile = UserProfile()
             
             # Find all input fields that might still be empty
@@ -813,7 +813,7 @@ class ApplicationEngine:
                             text = await opt.inner_text()
                             option_texts.append(text.strip())
                         
-                        best_option = get_select_value(name, label, option_texts, profile)
+                        best_option = get_select_value(name, label, OptionIndex.of(option_texts), profile)
                         if best_option:
                             for opt in options:
                                 text = await opt.inner_text()
@@ -195,7 +195,8 @@ def create_summary_message(jobs: List[Dict], date_str: str) -> List[Dict]:
 def send_job_summary(
     jobs: List[Dict],
     user_id: Optional[str] = None,
-    channel: Optional[str] = None
+    channel: Optional[str] = None,
+    client: Optional[WebClient] = None
 ) -> Dict:
     """
     Send the daily job summary to Slack.
@@ -204,13 +205,14 @@ def send_job_summary(
         jobs: List of job dictionaries with match scores
         user_id: Slack user ID to DM (if no channel specified)
         channel: Slack channel ID to post to
+        client: Existing Slack client to reuse (defaults to a new one)
     
     Returns:
         Slack API response
     """
     from datetime import datetime
     
-    client = get_slack_client()
+    client = client or get_slack_client()
     config = load_config()
     
     date_str = datetime.now().strftime("%B %d, %Y")